@@ -0,0 +1,14 @@
+-- Composite indexes for user-scoped, newest-first task lists
+-- (list_tasks and GET /tasks). See src/models.py Task.__table_args__.
+-- created_at DESC matches ORDER BY created_at DESC, so Postgres reads
+-- rows in order with no sort step. id DESC is the keyset pagination
+-- tie-breaker for GET /tasks (ORDER BY created_at DESC, id DESC).
+--
+-- CONCURRENTLY avoids locking writes; it cannot run inside a transaction,
+-- so apply with plain psql (autocommit), not a migration transaction.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_task_user_completed_created
+    ON task (user_id, completed, created_at DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_task_user_created
+    ON task (user_id, created_at DESC, id DESC);
@@ -0,0 +1,14 @@
+-- Trigram GIN indexes serving GET /tasks?search= (ILIKE '%term%').
+-- The app never creates the extension itself (init_db's create_all skips
+-- these indexes until pg_trgm exists), so run this as a role allowed to
+-- create extensions.
+--
+-- Run outside a transaction (CONCURRENTLY), see DEPLOYMENT.md.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_task_title_trgm
+    ON task USING gin (title gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_task_description_trgm
+    ON task USING gin (description gin_trgm_ops);
@@ -4,13 +4,19 @@ Reference: @specs/features/chatbot.md
 Uses Groq API with Llama model - generous free tier (14,000 tokens/min).
 """
 
-import json
-import os
+import asyncio
+import re
+from collections.abc import AsyncIterator, Callable
+from contextlib import aclosing, suppress
+from functools import lru_cache
 from typing import Any
 
 import httpx
+import orjson
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.cache import CacheKey, response_cache
+from src.config import get_settings
 from src.mcp_tools import MCPToolExecutor
 
 # System prompt for the AI agent - Phase V enabled
@@ -37,9 +43,199 @@ Examples:
 - "Add task buy milk" → {"tool": "add_task", "args": {"title": "buy milk"}}
 
 If no tool is needed, respond normally with text.
-Format task lists nicely showing: ✅/❌ status, 📌 priority, 📅 due date if set.
 """
 
+# Static request prefix - kept byte-identical across requests so Groq's
+# automatic prompt (prefix) caching can reuse it; dynamic history goes after
+GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
+GROQ_MODEL = "llama-3.3-70b-versatile"
+SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+# Chat history window sent to the model (user/assistant pairs)
+MAX_HISTORY_PAIRS = 5
+HISTORY_TRUNCATED_NOTE = {
+    "role": "system",
+    "content": (
+        "Earlier messages in this conversation were omitted. The user has been "
+        "managing their tasks; call list_tasks for current task IDs."
+    ),
+}
+
+# Tools whose results depend only on the user's tasks - safe to cache
+READ_ONLY_TOOLS = frozenset({"list_tasks"})
+
+# Messages likely to end in list_tasks - the task list is fetched while the
+# LLM is still generating (see TodoAgent._speculate_list_tasks)
+_LIKELY_LIST = re.compile(r"\b(?:tasks?|todos?|list|pending|due)\b", re.IGNORECASE)
+# ...unless it asks for a change, which rarely ends in list_tasks
+_MUTATION_VERB = re.compile(
+    r"\b(?:add|create|new|delete|remove|complete|finish|mark|update|rename"
+    r"|change|set)\b",
+    re.IGNORECASE,
+)
+
+
+# ============================================================================
+# FAST INTENTS - unambiguous commands answered without an LLM round-trip
+# ============================================================================
+
+# Bounded so int() never sees a huge digit string (int4 ids are <= 10 digits);
+# longer numbers fall through to the LLM
+_TASK_ID = r"(?:task\s+)?#?(?P<task_id>\d{1,10})"
+
+_FAST_INTENTS: tuple[tuple[re.Pattern[str], str, dict[str, Any]], ...] = tuple(
+    (re.compile(pattern, re.IGNORECASE), tool_name, args)
+    for pattern, tool_name, args in (
+        (
+            r"(?:show|list)\s+(?:me\s+)?(?:all\s+)?(?:my\s+)?tasks?",
+            "list_tasks",
+            {"status": "all"},
+        ),
+        (
+            r"(?:what(?:'s|\s+is|\s+are)\s+|(?:show|list)\s+(?:me\s+)?(?:my\s+)?)?"
+            r"(?:pending|incomplete|unfinished)(?:\s+tasks?)?",
+            "list_tasks",
+            {"status": "pending"},
+        ),
+        (
+            r"(?:show|list)\s+(?:me\s+)?(?:my\s+)?(?:completed|finished|done)\s+tasks?",
+            "list_tasks",
+            {"status": "completed"},
+        ),
+        (rf"(?:complete|finish)\s+{_TASK_ID}", "complete_task", {}),
+        (
+            rf"mark\s+{_TASK_ID}\s+(?:as\s+)?(?:complete|completed|done)",
+            "complete_task",
+            {},
+        ),
+        (rf"(?:delete|remove)\s+{_TASK_ID}", "delete_task", {}),
+    )
+)
+
+
+def _trim_history(
+    history: list[dict[str, str]],
+    max_pairs: int = MAX_HISTORY_PAIRS,
+) -> list[dict[str, str]]:
+    """Keep only the most recent messages so prompt size stays bounded."""
+    max_messages = 2 * max_pairs
+    if len(history) <= max_messages:
+        return history
+    return [HISTORY_TRUNCATED_NOTE, *history[-max_messages:]]
+
+
+def _parse_tool_call(message: str) -> dict[str, Any] | None:
+    """Return the tool call encoded in a model reply, or None if it isn't one."""
+    try:
+        tool_data = orjson.loads(message)
+    except orjson.JSONDecodeError:
+        return None
+    if isinstance(tool_data, dict) and "tool" in tool_data:
+        return tool_data
+    return None
+
+
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide Groq HTTP client.
+
+    TodoAgent is created per request, so the client (and its keep-alive
+    connection pool) lives at module level to reuse TCP + TLS connections.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _http_client
+
+
+@lru_cache
+def get_groq_headers() -> dict[str, str]:
+    """Return the Groq request headers, built once per process."""
+    return {
+        "Authorization": f"Bearer {get_settings().groq_api_key}",
+        "Content-Type": "application/json",
+    }
+
+
+async def close_http_client() -> None:
+    """Close the shared Groq HTTP client (called on app shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _fast_intent(message: str) -> tuple[str, dict[str, Any]] | None:
+    """Map an unambiguous command to (tool_name, arguments), or None."""
+    text = message.strip().rstrip("?!.").strip()
+    for pattern, tool_name, args in _FAST_INTENTS:
+        match = pattern.fullmatch(text)
+        if match:
+            arguments = dict(args)
+            if "task_id" in pattern.groupindex:
+                arguments["task_id"] = int(match["task_id"])
+            return tool_name, arguments
+    return None
+
+
+# ============================================================================
+# RESPONSE TEMPLATES - tool results rendered locally, no second LLM call
+# ============================================================================
+
+
+def _render_task_list(tasks: list[dict[str, Any]]) -> str:
+    """✅/❌ status, 📌 priority, 📅 due date - one task per line."""
+    if not tasks:
+        return "No tasks found. Add one!"
+    lines = []
+    for task in tasks:
+        status = "✅" if task["completed"] else "❌"
+        line = f"{status} #{task['id']} {task['title']} 📌 {task['priority']}"
+        if "due_date" in task:
+            line += f" 📅 {task['due_date']}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _render_added_task(result: dict[str, Any]) -> str:
+    """Confirmation for add_task, including due date/reminder if set."""
+    text = f"✅ Added task {result['task_id']}: \"{result['title']}\""
+    text += f" 📌 {result['priority']}"
+    if "due_date" in result:
+        text += f" 📅 {result['due_date']}"
+    if "reminder_at" in result:
+        text += f" ⏰ {result['reminder_at']}"
+    return text
+
+
+_TEMPLATES: dict[str, Callable[[Any], str]] = {
+    "add_task": _render_added_task,
+    "list_tasks": _render_task_list,
+    "complete_task": lambda r: f"✅ Completed task {r['task_id']}: {r['title']}",
+    "delete_task": lambda r: f"🗑️ Deleted task {r['task_id']}: {r['title']}",
+    "update_task": lambda r: f"✏️ Updated task {r['task_id']}: {r['title']}",
+}
+
+
+def _format_tool_result(tool_name: str, result: dict[str, Any] | list) -> str:
+    """Render a tool result as a user-facing reply."""
+    if isinstance(result, dict) and "error" in result:
+        return f"❌ {result['error']}"
+
+    template = _TEMPLATES.get(tool_name)
+    if template is None:
+        return orjson.dumps(result).decode()
+    return template(result)
+
+
+class GroqAPIError(Exception):
+    """Raised when the Groq API returns a non-200 response."""
+
 
 class TodoAgent:
     """Groq-powered Todo Agent using Llama model."""
@@ -48,8 +244,10 @@ class TodoAgent:
         self.session = session
         self.user_id = user_id
         self.tool_executor = MCPToolExecutor(session, user_id)
-        self.api_key = os.getenv("GROQ_API_KEY")
-        self.api_url = "https://api.groq.com/openai/v1/chat/completions"
+        self.api_url = GROQ_API_URL
+        self._headers = get_groq_headers()
+        self._client = get_http_client()
+        self.tool_calls_made: list[str] = []
 
     async def chat(
         self,
@@ -57,76 +255,176 @@ class TodoAgent:
         history: list[dict[str, str]],
     ) -> tuple[str, list[str]]:
         """Process a chat message and return response with tool calls."""
-        tool_calls_made: list[str] = []
-        
+        chunks = [chunk async for chunk in self.chat_stream(user_message, history)]
+        return "".join(chunks), self.tool_calls_made
+
+    async def chat_stream(
+        self,
+        user_message: str,
+        history: list[dict[str, str]],
+    ) -> AsyncIterator[str]:
+        """Process a chat message, yielding response text as it is generated.
+
+        Tool calls made are available in self.tool_calls_made once the
+        stream is exhausted.
+        """
+        self.tool_calls_made = []
+
+        # Repeated read-only questions ("show my tasks") skip the LLM entirely
+        cache_key = response_cache.key(self.user_id, user_message)
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            response_text, self.tool_calls_made = cached
+            yield response_text
+            return
+
+        # Unambiguous commands ("delete task 5") go straight to the tool
+        intent = _fast_intent(user_message)
+        if intent is not None:
+            tool_name, arguments = intent
+            self.tool_calls_made.append(tool_name)
+            tool_result = await self.tool_executor.execute_tool(tool_name, arguments)
+            response_text = _format_tool_result(tool_name, tool_result)
+            self._remember(cache_key, response_text)
+            yield response_text
+            return
+
         # Build messages array
-        messages = [{"role": "system", "content": SYSTEM_PROMPT}]
-        messages.extend(history)
+        messages = [SYSTEM_MESSAGE]
+        messages.extend(_trim_history(history))
         messages.append({"role": "user", "content": user_message})
-        
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Make request to Groq
-            response = await client.post(
-                self.api_url,
-                json={
-                    "model": "llama-3.3-70b-versatile",
-                    "messages": messages,
-                    "temperature": 0.7,
-                    "max_tokens": 1024,
-                },
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                }
-            )
-            
+
+        # Hide DB latency behind LLM latency: the list is fetched while the
+        # model generates and reused if it asks for list_tasks(status="all")
+        speculative = self._speculate_list_tasks(user_message)
+        try:
+            # Stream from Groq: plain text is forwarded as it arrives, a tool call
+            # (JSON object) is buffered and the stream cut as soon as it parses.
+            # is_tool_call stays None until the first non-whitespace character.
+            assistant_message = ""
+            is_tool_call: bool | None = None
+            tool_data: dict[str, Any] | None = None
+            try:
+                async with aclosing(self._stream_completion(messages)) as stream:
+                    async for chunk in stream:
+                        if is_tool_call is False:
+                            yield chunk
+                            continue
+
+                        assistant_message += chunk
+                        if is_tool_call is None:
+                            # Everything buffered so far is whitespace, so only the
+                            # new chunk needs scanning - no strip() copies
+                            first = next((c for c in chunk if not c.isspace()), "")
+                            if not first:
+                                continue
+                            is_tool_call = first == "{"
+                            if not is_tool_call:
+                                yield assistant_message
+                                continue
+
+                        # Only attempt a parse once the object may be closed
+                        if chunk.rstrip().endswith("}"):
+                            tool_data = _parse_tool_call(assistant_message)
+                            if tool_data is not None:
+                                break
+            except GroqAPIError as e:
+                yield f"Sorry, I encountered an error: {str(e)[:200]}"
+                return
+
+            if is_tool_call and tool_data is None:
+                # Stream ended after the closing brace (e.g. trailing newline)
+                tool_data = _parse_tool_call(assistant_message)
+
+            if tool_data is None:
+                if is_tool_call is not False:
+                    yield assistant_message
+                return
+
+            tool_name = tool_data["tool"]
+            arguments = tool_data.get("args", {})
+            self.tool_calls_made.append(tool_name)
+
+            # Execute the tool (or pick up the speculative list)
+            if (
+                speculative is not None
+                and tool_name == "list_tasks"
+                and arguments.get("status", "all") == "all"
+            ):
+                tool_result = await speculative
+            else:
+                if speculative is not None:
+                    with suppress(Exception):
+                        await speculative
+                tool_result = await self.tool_executor.execute_tool(
+                    tool_name, arguments
+                )
+
+            # Render the result locally - no second LLM round-trip
+            response_text = _format_tool_result(tool_name, tool_result)
+            self._remember(cache_key, response_text)
+            yield response_text
+        finally:
+            if speculative is not None:
+                # Never cancelled mid-query: the session must be idle again
+                # before anything else touches it
+                with suppress(Exception):
+                    await speculative
+
+    async def _stream_completion(
+        self,
+        messages: list[dict[str, str]],
+    ) -> AsyncIterator[str]:
+        """Stream a Groq chat completion, yielding content deltas.
+
+        Groq sends Server-Sent Events: one "data: {json}" line per chunk,
+        terminated by "data: [DONE]".
+        """
+        async with self._client.stream(
+            "POST",
+            self.api_url,
+            content=orjson.dumps({
+                "model": GROQ_MODEL,
+                "messages": messages,
+                "temperature": 0.7,
+                "max_tokens": 1024,
+                "stream": True,
+            }),
+            headers=self._headers,
+        ) as response:
             if response.status_code != 200:
-                error_text = response.text
+                error_text = (await response.aread()).decode(errors="replace")
                 print(f"Groq API error: {response.status_code} - {error_text}")
-                return f"Sorry, I encountered an error: {error_text[:200]}", []
-            
-            result = response.json()
-            assistant_message = result["choices"][0]["message"]["content"]
-            
-            # Check if the response is a tool call (JSON format)
-            try:
-                # Try to parse as JSON tool call
-                if assistant_message.strip().startswith("{"):
-                    tool_data = json.loads(assistant_message)
-                    if "tool" in tool_data:
-                        tool_name = tool_data["tool"]
-                        arguments = tool_data.get("args", {})
-                        tool_calls_made.append(tool_name)
-                        
-                        # Execute the tool
-                        tool_result = await self.tool_executor.execute_tool(tool_name, arguments)
-                        
-                        # Add tool result to messages and get final response
-                        messages.append({"role": "assistant", "content": assistant_message})
-                        messages.append({
-                            "role": "user", 
-                            "content": f"Tool result: {json.dumps(tool_result)}\n\nPlease provide a friendly response to the user based on this result."
-                        })
-                        
-                        # Get final response
-                        response = await client.post(
-                            self.api_url,
-                            json={
-                                "model": "llama-3.3-70b-versatile",
-                                "messages": messages,
-                                "temperature": 0.7,
-                                "max_tokens": 1024,
-                            },
-                            headers={
-                                "Authorization": f"Bearer {self.api_key}",
-                                "Content-Type": "application/json"
-                            }
-                        )
-                        
-                        if response.status_code == 200:
-                            result = response.json()
-                            return result["choices"][0]["message"]["content"], tool_calls_made
-            except json.JSONDecodeError:
-                pass
-            
-            return assistant_message, tool_calls_made
+                raise GroqAPIError(error_text)
+
+            async for line in response.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                data = line[len("data: "):]
+                if data == "[DONE]":
+                    break
+                choices = orjson.loads(data).get("choices")
+                if choices:
+                    content = choices[0].get("delta", {}).get("content")
+                    if content:
+                        yield content
+
+    def _speculate_list_tasks(
+        self, user_message: str
+    ) -> asyncio.Task[list[dict[str, Any]]] | None:
+        """Start list_tasks("all") in the background if the message hints at it.
+
+        Only the read-only list is ever speculated - mutations must not be,
+        and mutation requests skip speculation entirely.
+        """
+        if _MUTATION_VERB.search(user_message):
+            return None
+        if not _LIKELY_LIST.search(user_message):
+            return None
+        return asyncio.create_task(self.tool_executor.list_tasks("all"))
+
+    def _remember(self, cache_key: CacheKey, response_text: str) -> None:
+        """Cache a response if it only used read-only tools."""
+        tool_calls = self.tool_calls_made
+        if tool_calls and READ_ONLY_TOOLS.issuperset(tool_calls):
+            response_cache.set(cache_key, (response_text, list(tool_calls)))
@@ -0,0 +1,153 @@
+"""In-process caches for the AI chat agent.
+
+Reference: @specs/features/chatbot.md
+- Per-user task version counters, bumped when a task mutation commits
+- ResponseCache short-circuits repeated read-only chat turns
+- task_list_cache holds list_tasks results between mutations
+
+Caches live in the API process only. Every key includes the user's task
+version, so any write through this process invalidates that user's entries.
+Writes served by another replica never reach this process's versions, so
+the caches must be off whenever more than one replica runs
+(IN_PROCESS_CACHE=false, set by the Helm chart when replicaCount > 1).
+"""
+
+import hashlib
+import re
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.config import get_settings
+
+# Task version per user - bumped when a create/update/delete commits
+user_versions: dict[str, int] = defaultdict(int)
+
+_PENDING_BUMPS = "pending_task_version_bumps"
+
+
+def bump_tasks_version_on_commit(session: AsyncSession, user_id: str) -> None:
+    """Invalidate a user's cached reads once `session` commits.
+
+    Every task write path calls this before committing; the after_commit
+    listener below applies the bump. Bumping before the commit would let a
+    concurrent read cache the pre-commit rows under the new version.
+    """
+    session.info.setdefault(_PENDING_BUMPS, set()).add(user_id)
+
+
+def has_pending_bump(session: AsyncSession, user_id: str) -> bool:
+    """True if `session` holds uncommitted task writes for the user."""
+    return user_id in session.info.get(_PENDING_BUMPS, ())
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_bumps(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_BUMPS, ()):
+        user_versions[user_id] += 1
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_bumps(session: Session, previous_transaction) -> None:
+    # Not after_rollback: it also fires for a SAVEPOINT rollback, which
+    # would drop bumps for outer-transaction writes that still commit
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_BUMPS, None)
+
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_message(message: str) -> str:
+    """Normalize a chat message so trivial variations share a cache entry.
+
+    "Show my tasks!", "show my tasks" and "  SHOW  my tasks?" all map to
+    "show my tasks".
+    """
+    message = _PUNCTUATION.sub(" ", message.lower())
+    return _WHITESPACE.sub(" ", message).strip()
+
+
+class TTLCache[K, V]:
+    """Small LRU cache whose entries also expire after `ttl` seconds.
+
+    Safe without a lock: get/set never await, so they cannot interleave
+    on the event loop. A disabled cache always misses and stores nothing.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 300.0,
+        enabled: bool = True,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.enabled = enabled
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        """Return a cached value, or None on miss/expiry."""
+        if not self.enabled:
+            return None
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        if not self.enabled:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+CacheKey = tuple[str, str, int]
+
+
+class ResponseCache(TTLCache[CacheKey, tuple[str, list[str]]]):
+    """Cache of agent responses.
+
+    Key = (user_id, sha256(normalized message), task version).
+    Value = (response_text, tool_calls_made) as returned by TodoAgent.chat.
+    """
+
+    def key(self, user_id: str, message: str) -> CacheKey:
+        """Build the cache key for a message at the user's current version."""
+        digest = hashlib.sha256(normalize_message(message).encode()).hexdigest()
+        return (user_id, digest, user_versions[user_id])
+
+    def get(self, key: CacheKey) -> tuple[str, list[str]] | None:
+        """Return a cached (response_text, tool_calls) pair, or None."""
+        entry = super().get(key)
+        if entry is None:
+            return None
+        response_text, tool_calls = entry
+        return response_text, list(tool_calls)
+
+
+# Global cache instances - only safe with a single replica (see above)
+_ENABLED = get_settings().in_process_cache
+
+response_cache = ResponseCache(enabled=_ENABLED)
+
+# list_tasks results keyed by (user_id, status, task version) - read-only,
+# callers must not mutate the returned dicts
+task_list_cache: TTLCache[tuple[str, str, int], list[dict[str, Any]]] = TTLCache(
+    maxsize=1024, ttl=60.0, enabled=_ENABLED
+)
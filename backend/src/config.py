@@ -20,6 +20,9 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    db_pool_size: int = 20  # connections opened (and warmed) at startup
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 1800  # seconds; reconnect before idle timeouts
 
     # Better Auth Shared Secret (CRITICAL: Must match frontend)
     better_auth_secret: str
@@ -28,6 +31,12 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 10080  # 7 days
 
+    # Phase III: AI Chatbot (Groq)
+    groq_api_key: str = ""
+    # Per-process chat/task-list caches; must be false with >1 replica,
+    # since other replicas' writes cannot invalidate them
+    in_process_cache: bool = True
+
     # CORS
     cors_origins: str = "http://localhost:3000"
 
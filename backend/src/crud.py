@@ -11,18 +11,21 @@ Reference: @specs/features/task-crud.md
 
 from datetime import datetime
 
-from sqlalchemy import func
+from sqlalchemy import bindparam, delete, func, lambda_stmt, tuple_
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.cache import bump_tasks_version_on_commit
 from src.models import (
     Priority,
     Tag,
     TagCreate,
     Task,
     TaskCreate,
+    TaskRead,
     TaskTagLink,
     TaskUpdate,
+    utcnow,
 )
 
 
@@ -30,6 +33,16 @@ from src.models import (
 # TASK CRUD - ALL QUERIES FILTER BY USER_ID
 # ============================================================================
 
+# Exactly the columns TaskRead exposes - list pages skip ORM hydration
+_TASK_READ_COLUMNS = tuple(getattr(Task, name) for name in TaskRead.model_fields)
+
+# Hot lookup shared by get/update/delete/toggle - built and compiled once
+_GET_TASK_STMT = lambda_stmt(
+    lambda: select(Task).where(
+        Task.id == bindparam("task_id"), Task.user_id == bindparam("user_id")
+    )
+)
+
 
 async def create_task(
     session: AsyncSession,
@@ -53,6 +66,7 @@ async def create_task(
             link = TaskTagLink(task_id=task.id, tag_id=tag_id)
             session.add(link)
 
+    bump_tasks_version_on_commit(session, user_id)
     await session.commit()
     await session.refresh(task)
 
@@ -71,7 +85,7 @@ async def get_task(
     Returns None if task doesn't exist OR belongs to different user.
     """
     result = await session.execute(
-        select(Task).where(Task.id == task_id, Task.user_id == user_id)
+        _GET_TASK_STMT, {"task_id": task_id, "user_id": user_id}
     )
     return result.scalar_one_or_none()
 
@@ -88,15 +102,20 @@ async def get_tasks(
     tag_id: int | None = None,
     sort_by: str = "created_at",
     sort_desc: bool = True,
-) -> list[Task]:
+    after: tuple[datetime, int] | None = None,
+) -> list[TaskRead]:
     """
     Get tasks with filtering, filtered by user_id.
     
     Per AC-002.1: Display all tasks belonging to current user.
     Per AC-002.4: Tasks are sorted by creation date (newest first).
+
+    `after` is a keyset cursor (created_at, id) for the default newest-first
+    order: only older tasks are returned and `skip` is ignored, so deep
+    pages cost the same as the first one.
     """
     # CRITICAL: Always filter by user_id
-    query = select(Task).where(Task.user_id == user_id)
+    query = select(*_TASK_READ_COLUMNS).where(Task.user_id == user_id)
 
     if completed is not None:
         query = query.where(Task.completed == completed)
@@ -116,15 +135,24 @@ async def get_tasks(
 
     # Sorting - default newest first per AC-002.4
     sort_column = getattr(Task, sort_by, Task.created_at)
+    order = [sort_column]
+    if sort_column is Task.created_at:
+        # id breaks created_at ties so keyset pages never skip or repeat rows
+        order.append(Task.id)
     if sort_desc:
-        query = query.order_by(sort_column.desc())
+        query = query.order_by(*(column.desc() for column in order))
     else:
-        query = query.order_by(sort_column.asc())
+        query = query.order_by(*(column.asc() for column in order))
 
-    query = query.offset(skip).limit(limit)
+    if after is not None:
+        query = query.where(tuple_(Task.created_at, Task.id) < after)
+    else:
+        query = query.offset(skip)
+
+    query = query.limit(limit)
 
     result = await session.execute(query)
-    return list(result.scalars().all())
+    return [TaskRead.model_validate(row._mapping) for row in result]
 
 
 async def update_task(
@@ -146,7 +174,7 @@ async def update_task(
     for key, value in update_dict.items():
         setattr(task, key, value)
 
-    task.updated_at = datetime.utcnow()
+    task.updated_at = utcnow()
 
     if task_data.tag_ids is not None:
         await session.execute(
@@ -156,11 +184,43 @@ async def update_task(
             link = TaskTagLink(task_id=task_id, tag_id=tag_id)
             session.add(link)
 
+    bump_tasks_version_on_commit(session, user_id)
     await session.commit()
     await session.refresh(task)
     return task
 
 
+async def delete_and_return_title(
+    session: AsyncSession,
+    task_id: int,
+    user_id: str,
+) -> str | None:
+    """
+    Delete a task, filtered by user_id, and return its title.
+
+    Per AC-004.3: Cannot delete another user's task.
+    One DELETE ... RETURNING (after clearing tag links) - no SELECT first.
+    Returns None if the task doesn't exist or belongs to a different user.
+    """
+    owned_task = select(Task.id).where(Task.id == task_id, Task.user_id == user_id)
+    await session.execute(
+        delete(TaskTagLink).where(TaskTagLink.task_id.in_(owned_task))
+    )
+    result = await session.execute(
+        delete(Task)
+        .where(Task.id == task_id, Task.user_id == user_id)
+        .returning(Task.title)
+    )
+    title = result.scalar_one_or_none()
+    if title is None:
+        await session.rollback()
+        return None
+
+    bump_tasks_version_on_commit(session, user_id)
+    await session.commit()
+    return title
+
+
 async def delete_task(
     session: AsyncSession,
     task_id: int,
@@ -171,13 +231,7 @@ async def delete_task(
     
     Per AC-004.3: Cannot delete another user's task.
     """
-    task = await get_task(session, task_id, user_id)
-    if not task:
-        return False
-
-    await session.delete(task)
-    await session.commit()
-    return True
+    return await delete_and_return_title(session, task_id, user_id) is not None
 
 
 async def toggle_task_complete(
@@ -195,8 +249,9 @@ async def toggle_task_complete(
         return None
 
     task.completed = not task.completed
-    task.updated_at = datetime.utcnow()
+    task.updated_at = utcnow()
 
+    bump_tasks_version_on_commit(session, user_id)
     await session.commit()
     await session.refresh(task)
     return task
@@ -206,19 +261,18 @@ async def get_task_stats(
     session: AsyncSession,
     user_id: str,
 ) -> dict[str, int]:
-    """Get task statistics for a user."""
-    total = await session.execute(
-        select(func.count(Task.id)).where(Task.user_id == user_id)
-    )
-    complete = await session.execute(
-        select(func.count(Task.id)).where(
-            Task.user_id == user_id,
-            Task.completed == True  # noqa: E712
-        )
-    )
+    """Get task statistics for a user.
 
-    total_count = total.scalar() or 0
-    complete_count = complete.scalar() or 0
+    One aggregate query - COUNT(*) FILTER (WHERE completed) - instead of a
+    separate count per bucket.
+    """
+    result = await session.execute(
+        select(
+            func.count(Task.id),
+            func.count(Task.id).filter(Task.completed == True),  # noqa: E712
+        ).where(Task.user_id == user_id)
+    )
+    total_count, complete_count = result.one()
 
     return {
         "total": total_count,
@@ -3,9 +3,11 @@
 Reference: @specs/database/schema.md
 """
 
+import asyncio
 import ssl
 from collections.abc import AsyncGenerator
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel
@@ -33,8 +35,9 @@ if "postgresql" in database_url:
     
     engine_kwargs.update({
         "pool_pre_ping": True,
-        "pool_size": 5,
-        "max_overflow": 10,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle,
         "connect_args": {"ssl": ssl_context},
     })
 
@@ -53,6 +56,21 @@ async def init_db() -> None:
         await conn.run_sync(SQLModel.metadata.create_all)
 
 
+async def warm_pool() -> None:
+    """Open pool_size connections up front so first requests skip TLS + auth.
+
+    The connections are held concurrently, then returned to the pool idle.
+    """
+    if "postgresql" not in database_url:
+        return
+
+    async def ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(ping() for _ in range(settings.db_pool_size)))
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting database session."""
     async with async_session_maker() as session:
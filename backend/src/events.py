@@ -16,6 +16,8 @@ from typing import Any
 import httpx
 from pydantic import BaseModel
 
+from src.models import utcnow
+
 
 class TaskEvent(BaseModel):
     """Event schema for task operations."""
@@ -90,7 +92,7 @@ class DaprEventPublisher:
             user_id=user_id,
             title=title,
             recurrence=recurrence,
-            timestamp=datetime.utcnow(),
+            timestamp=utcnow(),
         )
         return await self.publish("task-events", event.model_dump(mode="json"))
 
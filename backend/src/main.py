@@ -10,8 +10,9 @@ from collections.abc import AsyncIterator
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.agent import close_http_client
 from src.config import get_settings
-from src.database import init_db
+from src.database import init_db, warm_pool
 from src.routes import tasks, chat, dapr_events
 
 settings = get_settings()
@@ -23,11 +24,13 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     print("🚀 Starting Todo Evolution API...")
     print("📦 Initializing database...")
     await init_db()
+    await warm_pool()
     print("✅ Database ready!")
     print("🤖 AI Chatbot enabled (Phase III)")
     print("📡 Dapr Event-Driven enabled (Phase V)")
     yield
     print("👋 Shutting down...")
+    await close_http_client()
 
 
 app = FastAPI(
@@ -46,6 +49,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # keyset pagination for GET /tasks
 )
 
 # Include routers
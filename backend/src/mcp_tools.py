@@ -6,13 +6,23 @@ Implements 5 tools: add_task, list_tasks, complete_task, delete_task, update_tas
 These are FUNCTION DEFINITIONS for OpenAI Agents SDK, not an MCP server.
 """
 
-from datetime import datetime
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any
 
+from sqlalchemy import bindparam, delete, insert, lambda_stmt, update
+from sqlalchemy.sql import Select
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.models import Task
+from src.cache import (
+    bump_tasks_version_on_commit,
+    has_pending_bump,
+    task_list_cache,
+    user_versions,
+)
+from src.models import Priority, Task, TaskTagLink, sql_utcnow
 
 
 # ============================================================================
@@ -135,6 +145,105 @@ TOOL_DEFINITIONS = [
 ]
 
 
+# LLM priority strings -> enum (unknown values fall back to medium)
+_PRIORITY_MAP = {p.value: p for p in Priority}
+
+
+@lru_cache(maxsize=256)
+def _parse_iso(value: str) -> datetime | None:
+    """Parse an ISO datetime from the LLM ("Z" suffix allowed), None if invalid.
+
+    Offset-aware values are converted to naive UTC to match the TIMESTAMP
+    columns. Cached because the model tends to repeat the same timestamps.
+    """
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(UTC).replace(tzinfo=None)
+    return parsed
+
+
+_DATETIME_ARGS = ("due_date", "reminder_at")
+
+
+# task.id is a Postgres int4 SERIAL: anything outside this range can only
+# fail in the driver (and poison the transaction), so it is rejected here
+_MAX_TASK_ID = 2**31 - 1
+
+
+def _coerce_id(value: Any) -> int | None:
+    """Parse a task id from the LLM (int or digit string), None if invalid.
+
+    Stricter than int(): "2.7", 2.7 and True are rejected rather than
+    silently acting on task 2 or 1, as are ids no task can have
+    (below 1 or beyond int4).
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    # isdecimal(), not isdigit(): "²" is a digit that int() rejects; the
+    # length cap keeps int() clear of its digit limit (int4 has <= 10 digits)
+    elif isinstance(value, str):
+        value = value.strip()
+        if not (value.isdecimal() and len(value) <= 10):
+            return None
+        value = int(value)
+    if isinstance(value, int) and 1 <= value <= _MAX_TASK_ID:
+        return value
+    return None
+
+
+def _normalize_arguments(arguments: dict[str, Any]) -> dict[str, Any]:
+    """Coerce LLM tool arguments to the types the tool methods expect.
+
+    task_id -> int (None if invalid), priority -> Priority (unknown values
+    fall back to medium), ISO date strings -> datetime.
+    """
+    arguments = dict(arguments)
+    if "task_id" in arguments:
+        arguments["task_id"] = _coerce_id(arguments["task_id"])
+    if "priority" in arguments:
+        priority = str(arguments["priority"]).lower()
+        arguments["priority"] = _PRIORITY_MAP.get(priority, Priority.MEDIUM)
+    for field in _DATETIME_ARGS:
+        value = arguments.get(field)
+        if isinstance(value, str):
+            arguments[field] = _parse_iso(value) if value else None
+    return arguments
+
+
+def _list_tasks_select() -> Select:
+    """Columns list_tasks serializes - plain rows, no ORM objects."""
+    return (
+        select(
+            Task.id,
+            Task.title,
+            Task.completed,
+            Task.description,
+            Task.priority,
+            Task.due_date,
+            Task.reminder_at,
+        )
+        .where(Task.user_id == bindparam("user_id"))
+        .order_by(Task.created_at.desc())
+    )
+
+
+# Built once per process: lambda_stmt caches statement construction and the
+# compiled SQL, so each call only binds user_id
+_LIST_ALL_STMT = lambda_stmt(lambda: _list_tasks_select())
+_LIST_TASKS_STMTS = {
+    "all": _LIST_ALL_STMT,
+    "pending": _LIST_ALL_STMT
+    + (lambda s: s.where(Task.completed == False)),  # noqa: E712
+    "completed": _LIST_ALL_STMT
+    + (lambda s: s.where(Task.completed == True)),  # noqa: E712
+}
+
+
 class MCPToolExecutor:
     """Execute MCP tools against the database.
     
@@ -144,52 +253,40 @@ class MCPToolExecutor:
     def __init__(self, session: AsyncSession, user_id: str):
         self.session = session
         self.user_id = user_id
+        self._dispatch: dict[str, Callable[..., Awaitable[dict | list]]] = {
+            "add_task": self.add_task,
+            "list_tasks": self.list_tasks,
+            "complete_task": self.complete_task,
+            "delete_task": self.delete_task,
+            "update_task": self.update_task,
+        }
 
     async def add_task(
         self,
         title: str,
         description: str = "",
-        priority: str = "medium",
-        due_date: str | None = None,
-        reminder_at: str | None = None,
+        priority: Priority = Priority.MEDIUM,
+        due_date: datetime | None = None,
+        reminder_at: datetime | None = None,
     ) -> dict[str, Any]:
         """Add a new task with Phase V fields."""
-        from src.models import Priority
-        
-        # Parse due_date and reminder_at if provided
-        parsed_due_date = None
-        parsed_reminder_at = None
-        
-        if due_date:
-            try:
-                parsed_due_date = datetime.fromisoformat(due_date.replace('Z', '+00:00'))
-            except ValueError:
-                pass
-        
-        if reminder_at:
-            try:
-                parsed_reminder_at = datetime.fromisoformat(reminder_at.replace('Z', '+00:00'))
-            except ValueError:
-                pass
-        
-        # Map priority string to enum
-        priority_enum = Priority.MEDIUM
-        if priority.lower() == "high":
-            priority_enum = Priority.HIGH
-        elif priority.lower() == "low":
-            priority_enum = Priority.LOW
-        
-        task = Task(
-            title=title,
-            description=description,
-            user_id=self.user_id,
-            priority=priority_enum,
-            due_date=parsed_due_date,
-            reminder_at=parsed_reminder_at,
+        # Single INSERT ... RETURNING - no separate flush + refresh round-trips
+        stmt = (
+            insert(Task)
+            .values(
+                title=title,
+                description=description,
+                user_id=self.user_id,
+                priority=priority,
+                due_date=due_date,
+                reminder_at=reminder_at,
+            )
+            .returning(
+                Task.id, Task.title, Task.priority, Task.due_date, Task.reminder_at
+            )
         )
-        self.session.add(task)
-        await self.session.flush()
-        await self.session.refresh(task)
+        task = (await self.session.execute(stmt)).one()
+        bump_tasks_version_on_commit(self.session, self.user_id)
 
         result = {
             "task_id": task.id,
@@ -212,51 +309,67 @@ class MCPToolExecutor:
         List tasks with optional status filter.
         
         Per AC-CHAT-001.3: "What's pending?" → calls list_tasks(status="pending")
-        """
-        query = select(Task).where(Task.user_id == self.user_id)
 
-        if status == "pending":
-            query = query.where(Task.completed == False)  # noqa: E712
-        elif status == "completed":
-            query = query.where(Task.completed == True)  # noqa: E712
+        Results are cached per (user_id, status, task version), so repeated
+        lists between mutations don't hit the database. The cache is skipped
+        while this session holds uncommitted writes: the version only moves
+        on commit, so cached rows would miss them.
+        """
+        use_cache = not has_pending_bump(self.session, self.user_id)
+        cache_key = (self.user_id, status, user_versions[self.user_id])
+        if use_cache:
+            cached = task_list_cache.get(cache_key)
+            if cached is not None:
+                return list(cached)
 
-        result = await self.session.execute(query.order_by(Task.created_at.desc()))
-        tasks = result.scalars().all()
+        stmt = _LIST_TASKS_STMTS.get(status, _LIST_ALL_STMT)
+        result = await self.session.execute(stmt, {"user_id": self.user_id})
 
         task_list = []
-        for t in tasks:
+        for (
+            id_,
+            title,
+            completed,
+            description,
+            priority,
+            due_date,
+            reminder_at,
+        ) in result.all():
             task_data = {
-                "id": t.id,
-                "title": t.title,
-                "completed": t.completed,
-                "description": t.description,
-                "priority": t.priority.value if t.priority else "medium",
+                "id": id_,
+                "title": title,
+                "completed": completed,
+                "description": description,
+                "priority": priority.value if priority else "medium",
             }
-            if t.due_date:
-                task_data["due_date"] = t.due_date.isoformat()
-            if t.reminder_at:
-                task_data["reminder_at"] = t.reminder_at.isoformat()
+            if due_date:
+                task_data["due_date"] = due_date.isoformat()
+            if reminder_at:
+                task_data["reminder_at"] = reminder_at.isoformat()
             task_list.append(task_data)
-        
-        return task_list
+
+        if use_cache:
+            task_list_cache.set(cache_key, task_list)
+        return list(task_list)
 
     async def complete_task(
         self,
-        task_id: int | str,
+        task_id: int,
     ) -> dict[str, Any]:
         """Mark task as complete."""
-        task_id = int(task_id)  # Ensure int (LLM may pass string)
+        # Single UPDATE ... RETURNING - an empty result means not found
         result = await self.session.execute(
-            select(Task).where(Task.id == task_id, Task.user_id == self.user_id)
+            update(Task)
+            .where(Task.id == task_id, Task.user_id == self.user_id)
+            .values(completed=True, updated_at=sql_utcnow())
+            .returning(Task.id, Task.title)
         )
-        task = result.scalar_one_or_none()
+        task = result.first()
 
         if not task:
             return {"error": f"Task {task_id} not found"}
 
-        task.completed = True
-        task.updated_at = datetime.utcnow()
-        await self.session.flush()
+        bump_tasks_version_on_commit(self.session, self.user_id)
 
         return {
             "task_id": task.id,
@@ -266,21 +379,27 @@ class MCPToolExecutor:
 
     async def delete_task(
         self,
-        task_id: int | str,
+        task_id: int,
     ) -> dict[str, Any]:
         """Delete a task."""
-        task_id = int(task_id)  # Ensure int (LLM may pass string)
+        owned_task = select(Task.id).where(
+            Task.id == task_id, Task.user_id == self.user_id
+        )
+        # Tag links first (FK), then DELETE ... RETURNING - no SELECT up front
+        await self.session.execute(
+            delete(TaskTagLink).where(TaskTagLink.task_id.in_(owned_task))
+        )
         result = await self.session.execute(
-            select(Task).where(Task.id == task_id, Task.user_id == self.user_id)
+            delete(Task)
+            .where(Task.id == task_id, Task.user_id == self.user_id)
+            .returning(Task.title)
         )
-        task = result.scalar_one_or_none()
+        title = result.scalar_one_or_none()
 
-        if not task:
+        if title is None:
             return {"error": f"Task {task_id} not found"}
 
-        title = task.title
-        await self.session.delete(task)
-        await self.session.flush()
+        bump_tasks_version_on_commit(self.session, self.user_id)
 
         return {
             "task_id": task_id,
@@ -290,27 +409,30 @@ class MCPToolExecutor:
 
     async def update_task(
         self,
-        task_id: int | str,
+        task_id: int,
         title: str | None = None,
         description: str | None = None,
     ) -> dict[str, Any]:
         """Update a task."""
-        task_id = int(task_id)  # Ensure int (LLM may pass string)
+        values: dict[str, Any] = {"updated_at": sql_utcnow()}
+        if title:
+            values["title"] = title
+        if description is not None:
+            values["description"] = description
+
+        # Single UPDATE ... RETURNING - an empty result means not found
         result = await self.session.execute(
-            select(Task).where(Task.id == task_id, Task.user_id == self.user_id)
+            update(Task)
+            .where(Task.id == task_id, Task.user_id == self.user_id)
+            .values(**values)
+            .returning(Task.id, Task.title)
         )
-        task = result.scalar_one_or_none()
+        task = result.first()
 
         if not task:
             return {"error": f"Task {task_id} not found"}
 
-        if title:
-            task.title = title
-        if description is not None:
-            task.description = description
-
-        task.updated_at = datetime.utcnow()
-        await self.session.flush()
+        bump_tasks_version_on_commit(self.session, self.user_id)
 
         return {
             "task_id": task.id,
@@ -320,15 +442,11 @@ class MCPToolExecutor:
 
     async def execute_tool(self, name: str, arguments: dict[str, Any]) -> dict | list:
         """Execute a tool by name with given arguments."""
-        if name == "add_task":
-            return await self.add_task(**arguments)
-        elif name == "list_tasks":
-            return await self.list_tasks(**arguments)
-        elif name == "complete_task":
-            return await self.complete_task(**arguments)
-        elif name == "delete_task":
-            return await self.delete_task(**arguments)
-        elif name == "update_task":
-            return await self.update_task(**arguments)
-        else:
+        tool = self._dispatch.get(name)
+        if tool is None:
             return {"error": f"Unknown tool: {name}"}
+        normalized = _normalize_arguments(arguments)
+        # Reject bad ids before any SQL runs
+        if "task_id" in normalized and normalized["task_id"] is None:
+            return {"error": f"Invalid task_id: {arguments['task_id']}"}
+        return await tool(**normalized)
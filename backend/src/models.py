@@ -5,12 +5,60 @@ Reference: @specs/database/schema.md
 - Title max 100 chars, description max 1000 (AC-001.1, AC-001.2)
 """
 
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
 
+from sqlalchemy import Connection, DateTime, Index, desc, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
 from sqlmodel import Field, Relationship, SQLModel
 
 
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime.
+
+    Replaces the deprecated datetime.utcnow(). Timestamp columns are
+    TIMESTAMP WITHOUT TIME ZONE, which asyncpg only accepts naive values for.
+    """
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+class sql_utcnow(FunctionElement):  # noqa: N801 - SQL function style
+    """Database-side utcnow(): current UTC time as a naive timestamp.
+
+    Plain now() would be converted to the session time zone when stored
+    in a TIMESTAMP WITHOUT TIME ZONE column.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(sql_utcnow, "postgresql")
+def _pg_sql_utcnow(element, compiler, **kw) -> str:
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(sql_utcnow)
+def _default_sql_utcnow(element, compiler, **kw) -> str:
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+
+def _has_pg_trgm(ddl, target, bind, **kw) -> bool:
+    """ddl_if guard: build trigram indexes only if pg_trgm is installed.
+
+    The extension is created by migrations/002_task_search_trgm.sql, not
+    by the app, whose database role may not be allowed to.
+    """
+    if not isinstance(bind, Connection):  # offline DDL (no bind / mock engine)
+        return True
+    installed = bind.scalar(
+        text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+    )
+    return installed is not None
+
+
 class Priority(str, Enum):
     """Task priority levels."""
     HIGH = "high"
@@ -70,11 +118,40 @@ class Task(TaskBase, table=True):
     - AC-001.5: Task is associated with the logged-in user
     """
     __tablename__ = "task"
+    __table_args__ = (
+        # Index DDL for existing databases lives in backend/migrations/
+        # (create_all skips tables that already exist)
+        # list_tasks: WHERE user_id [AND completed] ORDER BY created_at DESC
+        # DESC matches the ORDER BY, so Postgres reads rows in order, no sort
+        Index(
+            "ix_task_user_completed_created",
+            "user_id",
+            "completed",
+            desc("created_at"),
+        ),
+        # id DESC: tie-breaker for keyset pagination on GET /tasks
+        Index("ix_task_user_created", "user_id", desc("created_at"), desc("id")),
+        # GET /tasks?search=: trigram GIN indexes serve ILIKE '%term%'
+        # (Postgres only, and skipped by create_all until pg_trgm exists -
+        # see migrations/002_task_search_trgm.sql)
+        Index(
+            "ix_task_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql", callable_=_has_pg_trgm),
+        Index(
+            "ix_task_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql", callable_=_has_pg_trgm),
+    )
     
     id: int | None = Field(default=None, primary_key=True)
     user_id: str = Field(index=True)  # CRITICAL: User who owns this task
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
     
     tags: list[Tag] = Relationship(back_populates="tasks", link_model=TaskTagLink)
 
@@ -156,8 +233,8 @@ class Conversation(SQLModel, table=True):
 
     id: int | None = Field(default=None, primary_key=True)
     user_id: str = Field(index=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
     messages: list["Message"] = Relationship(back_populates="conversation")
 
@@ -174,7 +251,7 @@ class Message(SQLModel, table=True):
     user_id: str = Field(index=True)
     role: str = Field(max_length=20)  # "user" or "assistant"
     content: str  # No max_length for chat messages
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
 
     conversation: Conversation | None = Relationship(back_populates="messages")
 
@@ -17,42 +17,33 @@ Flow per hackathon spec:
 9. Server holds NO state (ready for next request)
 """
 
-from datetime import datetime
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from typing import Annotated
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src.agent import TodoAgent
 from src.auth import CurrentUser, get_current_user, verify_user_access
-from src.database import get_session
-from src.models import ChatRequest, ChatResponse, Conversation, Message
+from src.database import async_session_maker, get_session
+from src.models import ChatRequest, ChatResponse, Conversation, Message, utcnow
 
 router = APIRouter(prefix="/api/{user_id}", tags=["Chat"])
 
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
 
 
-@router.post("/chat", response_model=ChatResponse)
-async def chat(
+async def _start_turn(
+    session: AsyncSession,
     user_id: str,
-    session: SessionDep,
     request: ChatRequest,
-    current_user: Annotated[CurrentUser, Depends(verify_user_access)],
-) -> ChatResponse:
-    """
-    Send a message to the AI Todo assistant.
-    
-    THIS IS A STATELESS ENDPOINT per AC-CHAT-002:
-    - Server holds NO state between requests
-    - Conversation history is fetched from database
-    - Messages are persisted to database
-    
-    Flow:
-    1. Receive message → 2. Load History from DB → 3. Run Agent → 
-    4. Store Response → 5. Return
-    """
+) -> tuple[Conversation, list[dict[str, str]]]:
+    """Steps 1-3: load or create the conversation, fetch history, store the
+    user message. Returns the conversation and the history for the agent."""
     # Step 1: Get or create conversation
     if request.conversation_id:
         result = await session.execute(
@@ -94,11 +85,16 @@ async def chat(
     session.add(user_message)
     await session.flush()
 
-    # Step 4: Run AI agent with MCP tools
-    agent = TodoAgent(session, user_id)
-    response_text, tool_calls = await agent.chat(request.message, history)
+    return conversation, history
+
 
-    # Step 5: Store assistant response in database
+async def _finish_turn(
+    session: AsyncSession,
+    conversation: Conversation,
+    user_id: str,
+    response_text: str,
+) -> None:
+    """Step 5: store the assistant response and commit the turn."""
     assistant_message = Message(
         conversation_id=conversation.id,
         user_id=user_id,
@@ -108,13 +104,92 @@ async def chat(
     session.add(assistant_message)
 
     # Update conversation timestamp
-    conversation.updated_at = datetime.utcnow()
+    conversation.updated_at = utcnow()
 
     await session.commit()
 
+
+@router.post("/chat", response_model=ChatResponse)
+async def chat(
+    user_id: str,
+    session: SessionDep,
+    request: ChatRequest,
+    current_user: Annotated[CurrentUser, Depends(verify_user_access)],
+) -> ChatResponse:
+    """
+    Send a message to the AI Todo assistant.
+    
+    THIS IS A STATELESS ENDPOINT per AC-CHAT-002:
+    - Server holds NO state between requests
+    - Conversation history is fetched from database
+    - Messages are persisted to database
+    
+    Flow:
+    1. Receive message → 2. Load History from DB → 3. Run Agent → 
+    4. Store Response → 5. Return
+    """
+    conversation, history = await _start_turn(session, user_id, request)
+
+    # Step 4: Run AI agent with MCP tools
+    agent = TodoAgent(session, user_id)
+    response_text, tool_calls = await agent.chat(request.message, history)
+
+    await _finish_turn(session, conversation, user_id, response_text)
+
     # Step 6: Return response - Server holds NO state now
     return ChatResponse(
         conversation_id=conversation.id,
         response=response_text,
         tool_calls=tool_calls,
     )
+
+
+@router.post("/chat/stream")
+async def chat_stream(
+    user_id: str,
+    request: ChatRequest,
+    current_user: Annotated[CurrentUser, Depends(verify_user_access)],
+) -> StreamingResponse:
+    """
+    Send a message to the AI Todo assistant and stream the reply (SSE).
+
+    Same stateless flow as POST /chat. Each event is `data: {json}`:
+    - {"delta": "..."} for every piece of response text
+    - {"conversation_id": 123, "tool_calls": [...], "done": true} at the end
+
+    The session is owned by the stream (not a request dependency) because
+    it must stay open until the last event is sent.
+    """
+    session = async_session_maker()
+    try:
+        conversation, history = await _start_turn(session, user_id, request)
+    except Exception:
+        await session.close()
+        raise
+
+    agent = TodoAgent(session, user_id)
+
+    async def event_stream() -> AsyncIterator[bytes]:
+        try:
+            chunks: list[str] = []
+            # aclosing: on client disconnect the agent's cleanup (awaiting
+            # its speculative query) must finish before the session closes
+            async with aclosing(
+                agent.chat_stream(request.message, history)
+            ) as stream:
+                async for chunk in stream:
+                    chunks.append(chunk)
+                    yield b"data: " + orjson.dumps({"delta": chunk}) + b"\n\n"
+
+            await _finish_turn(session, conversation, user_id, "".join(chunks))
+
+            done = {
+                "conversation_id": conversation.id,
+                "tool_calls": agent.tool_calls_made,
+                "done": True,
+            }
+            yield b"data: " + orjson.dumps(done) + b"\n\n"
+        finally:
+            await session.close()
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
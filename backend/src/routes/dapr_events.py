@@ -16,16 +16,17 @@ Recurring task creation
 Jobs API handler (POST /jobs/callback)
 """
 
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Any
 
 from fastapi import APIRouter, Request
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from src.cache import bump_tasks_version_on_commit
 from src.database import async_session_maker
 from src.events import event_publisher
-from src.models import Task, RecurrenceType
+from src.models import Task, RecurrenceType, utcnow
 from src.dapr_client import service_client, secrets_client, jobs_client
 
 router = APIRouter(tags=["Dapr Events"])
@@ -137,7 +138,7 @@ async def reminder_cron_handler() -> dict[str, str]:
     - Queries tasks where reminder_at <= now()
     - Publishes ReminderDue events
     """
-    now = datetime.utcnow()
+    now = utcnow()
     reminder_count = 0
 
     async with async_session_maker() as session:
@@ -164,6 +165,8 @@ async def reminder_cron_handler() -> dict[str, str]:
             task.reminder_at = None
 
         if tasks_due:
+            for user_id in {task.user_id for task in tasks_due}:
+                bump_tasks_version_on_commit(session, user_id)
             await session.commit()
 
     print(f"[CRON] Processed {reminder_count} reminder(s)")
@@ -189,7 +192,7 @@ async def create_next_recurring_task(
     automatically create the next task instance.
     """
     # Calculate next due date based on recurrence
-    now = datetime.utcnow()
+    now = utcnow()
     
     if recurrence == "daily":
         next_due = now + timedelta(days=1)
@@ -210,6 +213,7 @@ async def create_next_recurring_task(
             due_date=next_due,
         )
         session.add(new_task)
+        bump_tasks_version_on_commit(session, user_id)
         await session.commit()
         await session.refresh(new_task)
 
@@ -7,12 +7,24 @@ Reference: @specs/features/task-crud.md
 User isolation enforced on all operations.
 
 Reference: @specs/features/event-driven.md (Phase V)
-Every Create, Update, Delete publishes event via Dapr.
+Every Create, Update, Delete publishes event via Dapr - as a background
+task after the response is sent, so sidecar latency never delays it.
 """
 
+import base64
+from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import orjson
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Response,
+    status,
+)
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from src import crud
@@ -31,11 +43,45 @@ router = APIRouter(prefix="/api/{user_id}", tags=["Tasks"])
 
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# task.id is a Postgres int4 SERIAL
+_MAX_TASK_ID = 2**31 - 1
+
+
+def _encode_cursor(task: TaskRead) -> str:
+    """Opaque keyset cursor: base64url JSON of [created_at, id]."""
+    payload = orjson.dumps([task.created_at.isoformat(), task.id])
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Inverse of _encode_cursor; 400 for anything malformed.
+
+    Cursors are client-supplied, so values the query can't bind - a
+    tz-aware created_at (the column is naive UTC) or an id outside int4 -
+    are rejected here rather than failing in the driver.
+    """
+    try:
+        created_at, task_id = orjson.loads(base64.urlsafe_b64decode(cursor))
+        created_at = datetime.fromisoformat(created_at)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+    # type() rather than isinstance(): true and 1.9 are not ids
+    if (
+        created_at.tzinfo is not None
+        or type(task_id) is not int
+        or not 1 <= task_id <= _MAX_TASK_ID
+    ):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return created_at, task_id
+
 
 @router.get("/tasks", response_model=list[TaskRead])
 async def list_tasks(
     user_id: str,
     session: SessionDep,
+    response: Response,
     current_user: Annotated[CurrentUser, Depends(verify_user_access)],
     completed: bool | None = Query(None, description="Filter by completion status"),
     priority: Priority | None = Query(None, description="Filter by priority"),
@@ -44,14 +90,25 @@ async def list_tasks(
     sort_desc: bool = Query(True, description="Sort descending"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-) -> list[Task]:
+    cursor: str | None = Query(None, description="X-Next-Cursor of prior page"),
+) -> list[TaskRead]:
     """
     List all tasks for the authenticated user.
     
     Per AC-002.1: Display all tasks belonging to current user.
     Per AC-002.4: Tasks are sorted by creation date (newest first).
+
+    With the default sort, a full page sets X-Next-Cursor; pass it back as
+    `cursor` for keyset pagination instead of a growing `skip`.
     """
-    return await crud.get_tasks(
+    keyset = sort_by == "created_at" and sort_desc
+    if cursor is not None and not keyset:
+        raise HTTPException(
+            status_code=400,
+            detail="cursor requires the default sort (created_at, descending)",
+        )
+
+    tasks = await crud.get_tasks(
         session=session,
         user_id=user_id,
         completed=completed,
@@ -61,12 +118,17 @@ async def list_tasks(
         sort_desc=sort_desc,
         skip=skip,
         limit=limit,
+        after=_decode_cursor(cursor) if cursor is not None else None,
     )
+    if keyset and len(tasks) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = _encode_cursor(tasks[-1])
+    return tasks
 
 
 @router.post("/tasks", response_model=TaskRead, status_code=status.HTTP_201_CREATED)
 async def create_task(
     user_id: str,
+    background_tasks: BackgroundTasks,
     session: SessionDep,
     task_in: TaskCreate,
     current_user: Annotated[CurrentUser, Depends(verify_user_access)],
@@ -83,8 +145,9 @@ async def create_task(
     """
     task = await crud.create_task(session, task_in, user_id=user_id)
     
-    # Phase V: Publish event via Dapr sidecar
-    await event_publisher.publish_task_created(
+    # Phase V: Publish event via Dapr sidecar once the response is sent
+    background_tasks.add_task(
+        event_publisher.publish_task_created,
         task_id=task.id,
         user_id=user_id,
         title=task.title,
@@ -110,6 +173,7 @@ async def get_task(
 @router.put("/tasks/{task_id}", response_model=TaskRead)
 async def update_task(
     user_id: str,
+    background_tasks: BackgroundTasks,
     task_id: int,
     session: SessionDep,
     task_in: TaskUpdate,
@@ -130,8 +194,9 @@ async def update_task(
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    # Phase V: Publish event via Dapr sidecar
-    await event_publisher.publish_task_updated(
+    # Phase V: Publish event via Dapr sidecar once the response is sent
+    background_tasks.add_task(
+        event_publisher.publish_task_updated,
         task_id=task.id,
         user_id=user_id,
         title=task.title,
@@ -143,6 +208,7 @@ async def update_task(
 @router.delete("/tasks/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_task(
     user_id: str,
+    background_tasks: BackgroundTasks,
     task_id: int,
     session: SessionDep,
     current_user: Annotated[CurrentUser, Depends(verify_user_access)],
@@ -157,21 +223,17 @@ async def delete_task(
     
     Phase V: Publishes TaskDeleted event via Dapr.
     """
-    # Get task title before deletion for event
-    task = await crud.get_task(session, task_id, user_id=user_id)
-    if not task:
+    title = await crud.delete_and_return_title(session, task_id, user_id=user_id)
+    if title is None:
         raise HTTPException(status_code=404, detail="Task not found")
-    
-    title = task.title
-    success = await crud.delete_task(session, task_id, user_id=user_id)
-    
-    if success:
-        # Phase V: Publish event via Dapr sidecar
-        await event_publisher.publish_task_deleted(
-            task_id=task_id,
-            user_id=user_id,
-            title=title,
-        )
+
+    # Phase V: Publish event via Dapr sidecar once the response is sent
+    background_tasks.add_task(
+        event_publisher.publish_task_deleted,
+        task_id=task_id,
+        user_id=user_id,
+        title=title,
+    )
 
 
 @router.patch("/tasks/{task_id}/complete", response_model=TaskRead)
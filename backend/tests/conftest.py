@@ -0,0 +1,103 @@
+"""Shared test setup.
+
+src.database builds its engine and src.config reads required settings at
+import time, so defaults must be in place before test modules import src.
+CI sets the same values explicitly.
+"""
+
+import os
+from collections.abc import AsyncIterator, Iterator
+
+import httpx
+import orjson
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///./test.db")
+os.environ.setdefault("BETTER_AUTH_SECRET", "test-secret")
+
+
+@pytest.fixture
+async def session() -> AsyncIterator[AsyncSession]:
+    """Session on a fresh in-memory SQLite database."""
+    import src.models  # noqa: F401 - registers the tables
+
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+    await engine.dispose()
+
+
+async def add_task(
+    session: AsyncSession,
+    title: str,
+    user_id: str = "user-1",
+    description: str = "",
+) -> int:
+    """Insert a task directly (no tool or route) and return its id."""
+    from src.models import Task
+
+    task = Task(title=title, description=description, user_id=user_id)
+    session.add(task)
+    await session.commit()
+    return task.id
+
+
+@pytest.fixture(autouse=True)
+def reset_caches() -> Iterator[None]:
+    """Task versions and caches are process-wide; every test starts empty."""
+    from src.cache import response_cache, task_list_cache, user_versions
+
+    yield
+    user_versions.clear()
+    response_cache._entries.clear()
+    task_list_cache._entries.clear()
+
+
+class FakeGroq:
+    """Scripted Groq endpoint: each request streams the next queued reply.
+
+    A reply is a list of content deltas (one SSE event each), a string
+    (a single delta) or an int (an error status code). The body is
+    produced lazily, so sent[i] counts the deltas request i actually read.
+    """
+
+    def __init__(self) -> None:
+        self.replies: list[list[str] | str | int] = []
+        self.requests: list[dict] = []
+        self.sent: list[int] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(orjson.loads(request.content))
+        reply = self.replies.pop(0)
+        if isinstance(reply, int):
+            return httpx.Response(reply, text="upstream error")
+        deltas = [reply] if isinstance(reply, str) else reply
+        index = len(self.sent)
+        self.sent.append(0)
+
+        async def body() -> AsyncIterator[bytes]:
+            for delta in deltas:
+                self.sent[index] += 1
+                event = orjson.dumps({"choices": [{"delta": {"content": delta}}]})
+                yield b"data: " + event + b"\n\n"
+            yield b"data: [DONE]\n\n"
+
+        return httpx.Response(200, content=body())
+
+
+@pytest.fixture
+async def groq(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[FakeGroq]:
+    """Route the agent's shared HTTP client to a FakeGroq."""
+    from src import agent
+
+    fake = FakeGroq()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(fake))
+    monkeypatch.setattr(agent, "_http_client", client)
+    yield fake
+    await client.aclose()
@@ -0,0 +1,464 @@
+"""Tests for the chat agent's local shortcuts.
+
+- Fast intents: unambiguous commands mapped to a tool without the LLM
+- History trimming: prompt size stays bounded
+- Response cache: repeated read-only questions answered without the LLM
+- Streaming: Groq SSE deltas forwarded as they arrive, tool calls detected
+- Speculation: list_tasks fetched while the LLM generates, session kept serial
+"""
+
+import asyncio
+from typing import Any
+
+import pytest
+from sqlalchemy import event
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.agent import (
+    HISTORY_TRUNCATED_NOTE,
+    MAX_HISTORY_PAIRS,
+    SYSTEM_MESSAGE,
+    TodoAgent,
+    _fast_intent,
+    _trim_history,
+)
+from src.mcp_tools import MCPToolExecutor
+from src.models import Task
+from tests.conftest import FakeGroq, add_task
+
+
+class TestFastIntent:
+    """Tests for _fast_intent / _FAST_INTENTS."""
+
+    @pytest.mark.parametrize(
+        ("message", "expected"),
+        [
+            ("show my tasks", ("list_tasks", {"status": "all"})),
+            ("List all tasks!", ("list_tasks", {"status": "all"})),
+            ("what's pending?", ("list_tasks", {"status": "pending"})),
+            ("pending tasks", ("list_tasks", {"status": "pending"})),
+            ("show completed tasks", ("list_tasks", {"status": "completed"})),
+            ("complete task 3", ("complete_task", {"task_id": 3})),
+            ("mark #7 as done", ("complete_task", {"task_id": 7})),
+            ("delete task 5", ("delete_task", {"task_id": 5})),
+            ("  Remove 12.  ", ("delete_task", {"task_id": 12})),
+        ],
+    )
+    def test_unambiguous_command_maps_to_tool(
+        self, message: str, expected: tuple[str, dict]
+    ) -> None:
+        """Exact command phrasings skip the LLM."""
+        assert _fast_intent(message) == expected
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "remove task 5 from my list",
+            "delete task five",
+            "add a task buy milk",
+            "complete the report by friday",
+            "can you show my tasks for tomorrow",
+            "what tasks are due today",
+            "delete task " + "9" * 5000,
+            "",
+        ],
+    )
+    def test_other_phrasings_fall_through_to_llm(self, message: str) -> None:
+        """Anything beyond the exact command goes to the LLM."""
+        assert _fast_intent(message) is None
+
+    def test_returned_arguments_are_a_fresh_dict(self) -> None:
+        """Callers may mutate the arguments without touching the table."""
+        _, arguments = _fast_intent("show my tasks")
+        arguments["status"] = "completed"
+
+        assert _fast_intent("show my tasks") == ("list_tasks", {"status": "all"})
+
+    async def test_fast_intent_runs_tool_without_llm(
+        self, session: AsyncSession, groq: FakeGroq
+    ) -> None:
+        """"delete task N" is executed directly - no Groq request."""
+        task_id = await add_task(session, "Buy groceries")
+        agent = TodoAgent(session, "user-1")
+
+        reply, tool_calls = await agent.chat(f"delete task {task_id}", [])
+
+        assert reply == f"🗑️ Deleted task {task_id}: Buy groceries"
+        assert tool_calls == ["delete_task"]
+        assert groq.requests == []
+
+    async def test_near_miss_goes_to_llm(
+        self, session: AsyncSession, groq: FakeGroq
+    ) -> None:
+        """Anything _fast_intent rejects is sent to Groq."""
+        agent = TodoAgent(session, "user-1")
+        groq.replies.append("Which task should I remove?")
+
+        reply, tool_calls = await agent.chat("remove task 5 from my list", [])
+
+        assert reply == "Which task should I remove?"
+        assert tool_calls == []
+        assert len(groq.requests) == 1
+
+    async def test_long_task_id_goes_to_llm(
+        self, session: AsyncSession, groq: FakeGroq
+    ) -> None:
+        """A task number no int4 id can have is left to the LLM, not a 500."""
+        agent = TodoAgent(session, "user-1")
+        groq.replies.append("I couldn't find that task.")
+
+        reply, tool_calls = await agent.chat("delete task " + "9" * 5000, [])
+
+        assert reply == "I couldn't find that task."
+        assert tool_calls == []
+
+
+class TestTrimHistory:
+    """Tests for _trim_history."""
+
+    @staticmethod
+    def _history(count: int) -> list[dict[str, str]]:
+        return [{"role": "user", "content": str(i)} for i in range(count)]
+
+    def test_short_history_is_unchanged(self) -> None:
+        """History within the limit is returned as is."""
+        history = self._history(4)
+
+        assert _trim_history(history, max_pairs=2) is history
+
+    def test_long_history_keeps_most_recent_messages(self) -> None:
+        """Older messages are replaced by a single truncation note."""
+        history = self._history(7)
+
+        trimmed = _trim_history(history, max_pairs=2)
+
+        assert trimmed == [HISTORY_TRUNCATED_NOTE, *history[-4:]]
+
+    def test_empty_history(self) -> None:
+        """A new conversation has nothing to trim."""
+        assert _trim_history([]) == []
+
+    async def test_llm_request_carries_trimmed_history(
+        self, session: AsyncSession, groq: FakeGroq
+    ) -> None:
+        """Groq sees the system prompt, the window and the new message."""
+        history = self._history(2 * MAX_HISTORY_PAIRS + 3)
+        groq.replies.append("Noted.")
+
+        await TodoAgent(session, "user-1").chat("thanks", history)
+
+        assert groq.requests[0]["messages"] == [
+            SYSTEM_MESSAGE,
+            HISTORY_TRUNCATED_NOTE,
+            *history[-2 * MAX_HISTORY_PAIRS :],
+            {"role": "user", "content": "thanks"},
+        ]
+
+
+class TestResponseCache:
+    """Tests for the response-cache short-circuit in TodoAgent.chat_stream."""
+
+    LIST_CALL = '{"tool": "list_tasks", "args": {"status": "all"}}'
+
+    async def test_repeated_read_only_question_skips_llm(
+        self, session: AsyncSession, groq: FakeGroq
+    ) -> None:
+        """The same question (modulo case/punctuation) is served from cache."""
+        await add_task(session, "Buy groceries")
+        groq.replies.append(self.LIST_CALL)
+
+        first = await TodoAgent(session, "user-1").chat("what do I have", [])
+        second = await TodoAgent(session, "user-1").chat("What do I have?", [])
+
+        assert first == ("❌ #1 Buy groceries 📌 medium", ["list_tasks"])
+        assert second == first
+        assert len(groq.requests) == 1
+
+    async def test_committed_write_invalidates_cached_reply(
+        self, session: AsyncSession, groq: FakeGroq
+    ) -> None:
+        """A mutation bumps the task version, so the next ask misses."""
+        task_id = await add_task(session, "Buy groceries")
+        groq.replies += [self.LIST_CALL, self.LIST_CALL]
+        agent = TodoAgent(session, "user-1")
+
+        await agent.chat("what do I have", [])
+        await agent.chat(f"complete task {task_id}", [])
+        await session.commit()
+        reply, _ = await agent.chat("what do I have", [])
+
+        assert reply == "✅ #1 Buy groceries 📌 medium"
+        assert len(groq.requests) == 2
+
+    async def test_replies_from_mutating_tools_are_not_cached(
+        self, session: AsyncSession, groq: FakeGroq
+    ) -> None:
+        """Only read-only tool turns are replayed from the cache."""
+        add_call = '{"tool": "add_task", "args": {"title": "Buy milk"}}'
+        groq.replies += [add_call, add_call]
+        agent = TodoAgent(session, "user-1")
+
+        await agent.chat("I need milk", [])
+        reply, _ = await agent.chat("I need milk", [])
+
+        assert reply.startswith("✅ Added task 2")
+        assert len(groq.requests) == 2
+
+    async def test_cache_is_per_user(
+        self, session: AsyncSession, groq: FakeGroq
+    ) -> None:
+        """One user's cached reply is never served to another."""
+        await add_task(session, "Buy groceries", user_id="user-1")
+        groq.replies += [self.LIST_CALL, self.LIST_CALL]
+
+        await TodoAgent(session, "user-1").chat("what do I have", [])
+        reply, _ = await TodoAgent(session, "user-2").chat("what do I have", [])
+
+        assert reply == "No tasks found. Add one!"
+        assert len(groq.requests) == 2
+
+
+async def _stream(agent: TodoAgent, message: str) -> list[str]:
+    return [chunk async for chunk in agent.chat_stream(message, [])]
+
+
+class TestChatStream:
+    """Tests for streaming plain-text replies from Groq."""
+
+    async def test_text_is_forwarded_delta_by_delta(
+        self, session: AsyncSession, groq: FakeGroq
+    ) -> None:
+        """Plain text is not buffered until the reply completes."""
+        groq.replies.append(["Hello", " there", ", friend!"])
+
+        chunks = await _stream(TodoAgent(session, "user-1"), "hi")
+
+        assert chunks == ["Hello", " there", ", friend!"]
+        assert groq.requests[0]["stream"] is True
+
+    async def test_leading_whitespace_is_kept_with_first_text(
+        self, session: AsyncSession, groq: FakeGroq
+    ) -> None:
+        """Whitespace-only deltas are held until the reply type is known."""
+        groq.replies.append(["\n ", "Hi", "!"])
+
+        chunks = await _stream(TodoAgent(session, "user-1"), "hi")
+
+        assert chunks == ["\n Hi", "!"]
+
+    async def test_groq_error_becomes_apology(
+        self, session: AsyncSession, groq: FakeGroq
+    ) -> None:
+        """A non-200 response is reported to the user, not raised."""
+        groq.replies.append(500)
+
+        reply, tool_calls = await TodoAgent(session, "user-1").chat("hi", [])
+
+        assert reply == "Sorry, I encountered an error: upstream error"
+        assert tool_calls == []
+
+
+class TestToolCallDetection:
+    """Tests for spotting a JSON tool call in the Groq stream."""
+
+    async def test_tool_call_split_across_deltas_runs_tool(
+        self, session: AsyncSession, groq: FakeGroq
+    ) -> None:
+        """The JSON is buffered, never shown, and the tool result is."""
+        groq.replies.append(
+            ['  {"tool": "add_', 'task", "args": {"title"', ': "Buy milk"}}']
+        )
+
+        chunks = await _stream(TodoAgent(session, "user-1"), "I need milk")
+
+        assert chunks == ['✅ Added task 1: "Buy milk" 📌 medium']
+
+    async def test_stream_is_cut_once_the_call_parses(
+        self, session: AsyncSession, groq: FakeGroq
+    ) -> None:
+        """Deltas after the closing brace are never read."""
+        groq.replies.append(
+            ['{"tool": "list_tasks", "args": {}}', " and some", " chatter"]
+        )
+
+        reply, tool_calls = await TodoAgent(session, "user-1").chat("hmm", [])
+
+        assert reply == "No tasks found. Add one!"
+        assert tool_calls == ["list_tasks"]
+        assert groq.sent == [1]
+
+    async def test_inner_brace_then_newline_terminated_close(
+        self, session: AsyncSession, groq: FakeGroq
+    ) -> None:
+        """An inner "}" does not end the call; a "}\\n" delta does."""
+        groq.replies.append(['{"tool": "list_tasks", "args": {}', "}\n", "\n"])
+
+        reply, tool_calls = await TodoAgent(session, "user-1").chat("hmm", [])
+
+        assert reply == "No tasks found. Add one!"
+        assert tool_calls == ["list_tasks"]
+
+    async def test_json_that_is_not_a_tool_call_is_text(
+        self, session: AsyncSession, groq: FakeGroq
+    ) -> None:
+        """An object without "tool" is passed through verbatim."""
+        groq.replies.append(['{"not": ', '"a tool"}'])
+
+        reply, tool_calls = await TodoAgent(session, "user-1").chat("hmm", [])
+
+        assert reply == '{"not": "a tool"}'
+        assert tool_calls == []
+
+    async def test_braces_inside_text_are_not_a_call(
+        self, session: AsyncSession, groq: FakeGroq
+    ) -> None:
+        """Only a reply that starts with "{" is treated as JSON."""
+        groq.replies.append(["Use ", '{"tool": "x"}', " syntax"])
+
+        chunks = await _stream(TodoAgent(session, "user-1"), "how do tools work")
+
+        assert chunks == ["Use ", '{"tool": "x"}', " syntax"]
+
+
+class TestSpeculativeList:
+    """Tests for the list_tasks prefetch in TodoAgent.chat_stream.
+
+    The prefetch shares the request's session with the tool call that
+    follows, so it must be finished before anything else uses the session.
+    """
+
+    @pytest.fixture
+    def speculated(self, monkeypatch: pytest.MonkeyPatch) -> list[asyncio.Task]:
+        """Prefetch tasks started by any agent, slowed to outlive short replies."""
+        started: list[asyncio.Task] = []
+        speculate = TodoAgent._speculate_list_tasks
+        list_tasks = MCPToolExecutor.list_tasks
+
+        def spy(agent: TodoAgent, user_message: str) -> asyncio.Task | None:
+            task = speculate(agent, user_message)
+            if task is not None:
+                started.append(task)
+            return task
+
+        async def slow_list(self: MCPToolExecutor, status: str = "all") -> list:
+            await asyncio.sleep(0.05)
+            return await list_tasks(self, status)
+
+        monkeypatch.setattr(TodoAgent, "_speculate_list_tasks", spy)
+        monkeypatch.setattr(MCPToolExecutor, "list_tasks", slow_list)
+        return started
+
+    @pytest.fixture
+    def tool_calls(
+        self, monkeypatch: pytest.MonkeyPatch, speculated: list[asyncio.Task]
+    ) -> list[tuple[str, bool]]:
+        """(tool name, whether the prefetch had finished) per execute_tool."""
+        calls: list[tuple[str, bool]] = []
+        execute_tool = MCPToolExecutor.execute_tool
+
+        async def spy(
+            self: MCPToolExecutor, name: str, arguments: dict[str, Any]
+        ) -> dict | list:
+            calls.append((name, all(task.done() for task in speculated)))
+            return await execute_tool(self, name, arguments)
+
+        monkeypatch.setattr(MCPToolExecutor, "execute_tool", spy)
+        return calls
+
+    async def test_list_all_reuses_prefetched_list(
+        self,
+        session: AsyncSession,
+        groq: FakeGroq,
+        speculated: list[asyncio.Task],
+        tool_calls: list[tuple[str, bool]],
+    ) -> None:
+        """list_tasks(all) is answered from the prefetch - one SELECT only."""
+        await add_task(session, "Buy groceries")
+        selects: list[str] = []
+
+        def record(conn: object, cursor: object, statement: str, *_: object) -> None:
+            if statement.lstrip().upper().startswith("SELECT"):
+                selects.append(statement)
+
+        engine = session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", record)
+        groq.replies.append('{"tool": "list_tasks", "args": {"status": "all"}}')
+
+        reply, calls = await TodoAgent(session, "user-1").chat("my todo list", [])
+
+        event.remove(engine, "before_cursor_execute", record)
+        assert reply == "❌ #1 Buy groceries 📌 medium"
+        assert calls == ["list_tasks"]
+        assert len(speculated) == 1
+        assert tool_calls == []
+        assert len(selects) == 1
+
+    async def test_other_list_waits_for_prefetch(
+        self,
+        session: AsyncSession,
+        groq: FakeGroq,
+        speculated: list[asyncio.Task],
+        tool_calls: list[tuple[str, bool]],
+    ) -> None:
+        """list_tasks(pending) runs only after the prefetch has finished."""
+        await add_task(session, "Buy groceries")
+        groq.replies.append('{"tool": "list_tasks", "args": {"status": "pending"}}')
+
+        reply, _ = await TodoAgent(session, "user-1").chat("my todo list", [])
+
+        assert reply == "❌ #1 Buy groceries 📌 medium"
+        assert len(speculated) == 1
+        assert tool_calls == [("list_tasks", True)]
+
+    async def test_mutation_waits_for_prefetch_and_succeeds(
+        self,
+        session: AsyncSession,
+        groq: FakeGroq,
+        speculated: list[asyncio.Task],
+        tool_calls: list[tuple[str, bool]],
+    ) -> None:
+        """A mutation the message didn't hint at still runs after the prefetch."""
+        task_id = await add_task(session, "Buy groceries")
+        groq.replies.append(
+            f'{{"tool": "complete_task", "args": {{"task_id": {task_id}}}}}'
+        )
+
+        reply, _ = await TodoAgent(session, "user-1").chat("groceries task: done", [])
+        await session.commit()
+
+        assert reply == f"✅ Completed task {task_id}: Buy groceries"
+        assert len(speculated) == 1
+        assert tool_calls == [("complete_task", True)]
+        assert (await session.get(Task, task_id)).completed is True
+
+    async def test_text_reply_drains_prefetch(
+        self,
+        session: AsyncSession,
+        groq: FakeGroq,
+        speculated: list[asyncio.Task],
+    ) -> None:
+        """No tool call: the prefetch is still awaited before the stream ends."""
+        groq.replies.append("You have a few things on your list.")
+
+        reply, _ = await TodoAgent(session, "user-1").chat("my todo list", [])
+
+        assert reply == "You have a few things on your list."
+        assert len(speculated) == 1
+        assert speculated[0].done()
+
+    @pytest.mark.parametrize(
+        "message", ["add a task to buy milk", "delete my first task"]
+    )
+    async def test_mutation_request_is_not_speculated(
+        self,
+        session: AsyncSession,
+        groq: FakeGroq,
+        speculated: list[asyncio.Task],
+        message: str,
+    ) -> None:
+        """Messages with a mutation verb never start a prefetch."""
+        groq.replies.append("Which one?")
+
+        await TodoAgent(session, "user-1").chat(message, [])
+
+        assert speculated == []
@@ -0,0 +1,145 @@
+"""Tests for the in-process chat caches."""
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src import cache, crud
+from src.cache import (
+    TTLCache,
+    bump_tasks_version_on_commit,
+    has_pending_bump,
+    normalize_message,
+    user_versions,
+)
+from src.models import Task, TaskCreate
+
+
+class TestNormalizeMessage:
+    """Tests for normalize_message."""
+
+    @pytest.mark.parametrize(
+        "message",
+        ["show my tasks", "Show my tasks!", "  SHOW  my tasks?", "show\tmy\ntasks"],
+    )
+    def test_trivial_variations_share_a_key(self, message: str) -> None:
+        """Case, punctuation and whitespace are ignored."""
+        assert normalize_message(message) == "show my tasks"
+
+    def test_words_are_kept(self) -> None:
+        """Different requests stay different."""
+        assert normalize_message("show my tasks") != normalize_message(
+            "show my done tasks"
+        )
+
+
+class TestTTLCache:
+    """Tests for TTLCache expiry and LRU eviction."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch: pytest.MonkeyPatch) -> list[float]:
+        """Controllable time.monotonic() for the cache module."""
+        now = [1000.0]
+        monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+        return now
+
+    def test_get_returns_stored_value(self) -> None:
+        """A stored value is returned until it expires or is evicted."""
+        ttl_cache: TTLCache[str, int] = TTLCache()
+        ttl_cache.set("a", 1)
+
+        assert ttl_cache.get("a") == 1
+        assert ttl_cache.get("missing") is None
+
+    def test_entry_expires_after_ttl(self, clock: list[float]) -> None:
+        """Entries are served until their TTL passes, then dropped."""
+        ttl_cache: TTLCache[str, int] = TTLCache(ttl=10.0)
+        ttl_cache.set("a", 1)
+
+        clock[0] += 9.0
+        assert ttl_cache.get("a") == 1
+
+        clock[0] += 2.0
+        assert ttl_cache.get("a") is None
+        assert len(ttl_cache._entries) == 0
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        """A full cache drops the entry read or written longest ago."""
+        ttl_cache: TTLCache[str, int] = TTLCache(maxsize=2)
+        ttl_cache.set("a", 1)
+        ttl_cache.set("b", 2)
+        ttl_cache.get("a")  # "b" is now least recently used
+
+        ttl_cache.set("c", 3)
+
+        assert ttl_cache.get("b") is None
+        assert ttl_cache.get("a") == 1
+        assert ttl_cache.get("c") == 3
+
+    def test_disabled_cache_stores_nothing(self) -> None:
+        """IN_PROCESS_CACHE=false turns every lookup into a miss."""
+        ttl_cache: TTLCache[str, int] = TTLCache(enabled=False)
+        ttl_cache.set("a", 1)
+
+        assert ttl_cache.get("a") is None
+
+
+class TestTaskVersion:
+    """Tests for the per-user task version and its commit hook."""
+
+    async def test_bump_applies_on_commit(self, session: AsyncSession) -> None:
+        """The version only moves once the write is visible to others."""
+        bump_tasks_version_on_commit(session, "user-1")
+
+        assert user_versions["user-1"] == 0
+        assert has_pending_bump(session, "user-1")
+
+        await session.commit()
+
+        assert user_versions["user-1"] == 1
+        assert not has_pending_bump(session, "user-1")
+
+    async def test_bump_is_dropped_on_rollback(self, session: AsyncSession) -> None:
+        """Rolled-back writes never invalidate anything."""
+        session.add(Task(title="Buy milk", user_id="user-1"))
+        await session.flush()
+        bump_tasks_version_on_commit(session, "user-1")
+
+        await session.rollback()
+        await session.commit()
+
+        assert user_versions["user-1"] == 0
+        assert not has_pending_bump(session, "user-1")
+
+    async def test_savepoint_rollback_keeps_outer_bumps(
+        self, session: AsyncSession
+    ) -> None:
+        """Only the outermost rollback discards; the outer write commits."""
+        session.add(Task(title="Buy milk", user_id="user-1"))
+        await session.flush()
+        bump_tasks_version_on_commit(session, "user-1")
+
+        savepoint = await session.begin_nested()
+        await savepoint.rollback()
+        await session.commit()
+
+        assert user_versions["user-1"] == 1
+
+    async def test_repeated_bumps_in_one_transaction_count_once(
+        self, session: AsyncSession
+    ) -> None:
+        """Pending bumps are a set of users, applied once per commit."""
+        bump_tasks_version_on_commit(session, "user-1")
+        bump_tasks_version_on_commit(session, "user-1")
+        bump_tasks_version_on_commit(session, "user-2")
+
+        await session.commit()
+
+        assert user_versions == {"user-1": 1, "user-2": 1}
+
+    async def test_rest_writes_bump_through_the_hook(
+        self, session: AsyncSession
+    ) -> None:
+        """crud writes use the same commit hook as the MCP tools."""
+        await crud.create_task(session, TaskCreate(title="Buy milk"), "user-1")
+
+        assert user_versions["user-1"] == 1
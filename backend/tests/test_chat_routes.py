@@ -0,0 +1,93 @@
+"""Tests for POST /chat/stream (SSE chat replies)."""
+
+from collections.abc import AsyncIterator
+
+import httpx
+import orjson
+import pytest
+from fastapi import FastAPI
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.auth import CurrentUser, get_current_user
+from src.models import Message
+from src.routes import chat
+from tests.conftest import FakeGroq, add_task
+
+
+@pytest.fixture
+async def client(
+    session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Client for the chat routes as user-1, on the test database."""
+    monkeypatch.setattr(
+        chat,
+        "async_session_maker",
+        sessionmaker(bind=session.bind, class_=AsyncSession, expire_on_commit=False),
+    )
+    app = FastAPI()
+    app.include_router(chat.router)
+    app.dependency_overrides[get_current_user] = lambda: CurrentUser(id="user-1")
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+async def _events(response: httpx.Response) -> list[dict]:
+    return [
+        orjson.loads(line[len("data: "):])
+        async for line in response.aiter_lines()
+        if line.startswith("data: ")
+    ]
+
+
+class TestChatStream:
+    """Tests for the SSE framing and persistence of streamed turns."""
+
+    async def test_text_reply_is_streamed_and_stored(
+        self, session: AsyncSession, client: httpx.AsyncClient, groq: FakeGroq
+    ) -> None:
+        """One delta frame per piece of text, then a done frame."""
+        groq.replies.append(["Hello", " there!"])
+
+        async with client.stream(
+            "POST", "/api/user-1/chat/stream", json={"message": "hi"}
+        ) as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("text/event-stream")
+            events = await _events(response)
+
+        conversation_id = events[-1]["conversation_id"]
+        assert events == [
+            {"delta": "Hello"},
+            {"delta": " there!"},
+            {"conversation_id": conversation_id, "tool_calls": [], "done": True},
+        ]
+        result = await session.exec(
+            select(Message)
+            .where(Message.conversation_id == conversation_id)
+            .order_by(Message.id)
+        )
+        assert [(m.role, m.content) for m in result.all()] == [
+            ("user", "hi"),
+            ("assistant", "Hello there!"),
+        ]
+
+    async def test_done_frame_lists_tool_calls(
+        self, session: AsyncSession, client: httpx.AsyncClient, groq: FakeGroq
+    ) -> None:
+        """A tool turn streams the rendered result and names the tool."""
+        task_id = await add_task(session, "Buy groceries")
+
+        async with client.stream(
+            "POST",
+            "/api/user-1/chat/stream",
+            json={"message": f"delete task {task_id}"},
+        ) as response:
+            events = await _events(response)
+
+        assert events[0] == {"delta": f"🗑️ Deleted task {task_id}: Buy groceries"}
+        assert events[-1]["tool_calls"] == ["delete_task"]
+        assert events[-1]["done"] is True
+        assert groq.requests == []
@@ -0,0 +1,181 @@
+"""Tests for user-scoped task CRUD queries."""
+
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+
+import pytest
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src import crud
+from src.cache import has_pending_bump, user_versions
+from src.models import Tag, Task, TaskRead, TaskTagLink
+from tests.conftest import add_task
+
+T0 = datetime(2026, 1, 1, 12, 0)
+
+
+async def _add_tasks(
+    session: AsyncSession, user_id: str, *, pending: int = 0, done: int = 0
+) -> None:
+    session.add_all(
+        Task(title=f"task {i}", user_id=user_id, completed=i >= pending)
+        for i in range(pending + done)
+    )
+    await session.commit()
+
+
+class TestTaskStats:
+    """Tests for get_task_stats (one COUNT ... FILTER query)."""
+
+    async def test_counts_by_completion(self, session: AsyncSession) -> None:
+        """total, complete and pending come from a single aggregate."""
+        await _add_tasks(session, "user-1", pending=3, done=2)
+
+        stats = await crud.get_task_stats(session, "user-1")
+
+        assert stats == {"total": 5, "complete": 2, "pending": 3}
+
+    async def test_only_counts_own_tasks(self, session: AsyncSession) -> None:
+        """Other users' tasks never leak into the numbers."""
+        await _add_tasks(session, "user-1", pending=1)
+        await _add_tasks(session, "user-2", pending=4, done=4)
+
+        stats = await crud.get_task_stats(session, "user-1")
+
+        assert stats == {"total": 1, "complete": 0, "pending": 1}
+
+    async def test_no_tasks(self, session: AsyncSession) -> None:
+        """COUNT over no rows is zero, not NULL."""
+        stats = await crud.get_task_stats(session, "user-1")
+
+        assert stats == {"total": 0, "complete": 0, "pending": 0}
+
+
+class TestKeysetPagination:
+    """Tests for get_tasks(after=...) - (created_at, id) < cursor."""
+
+    @staticmethod
+    async def _pages(
+        session: AsyncSession, user_id: str, limit: int, **filters
+    ) -> list[list[TaskRead]]:
+        pages: list[list[TaskRead]] = []
+        after = None
+        while True:
+            page = await crud.get_tasks(
+                session, user_id, limit=limit, after=after, **filters
+            )
+            if not page:
+                return pages
+            pages.append(page)
+            after = (page[-1].created_at, page[-1].id)
+
+    async def test_pages_walk_newest_first_without_gaps(
+        self, session: AsyncSession
+    ) -> None:
+        """Each page continues exactly where the previous one stopped."""
+        session.add_all(
+            Task(title=f"t{i}", user_id="user-1", created_at=T0 + timedelta(i))
+            for i in range(7)
+        )
+        await session.commit()
+
+        pages = await self._pages(session, "user-1", limit=3)
+
+        assert [[task.title for task in page] for page in pages] == [
+            ["t6", "t5", "t4"],
+            ["t3", "t2", "t1"],
+            ["t0"],
+        ]
+
+    async def test_created_at_ties_are_broken_by_id(
+        self, session: AsyncSession
+    ) -> None:
+        """Tasks created in the same instant are neither skipped nor repeated."""
+        session.add_all(
+            Task(title=f"t{i}", user_id="user-1", created_at=T0) for i in range(5)
+        )
+        await session.commit()
+
+        pages = await self._pages(session, "user-1", limit=2)
+
+        ids = [task.id for page in pages for task in page]
+        assert ids == [5, 4, 3, 2, 1]
+
+    async def test_cursor_respects_user_and_filters(
+        self, session: AsyncSession
+    ) -> None:
+        """The keyset condition is added to, not instead of, the filters."""
+        session.add_all(
+            Task(
+                title=f"t{i}",
+                user_id="user-1" if i % 3 else "user-2",
+                completed=i % 2 == 0,
+                created_at=T0 + timedelta(i),
+            )
+            for i in range(12)
+        )
+        await session.commit()
+
+        pages = await self._pages(session, "user-1", limit=2, completed=False)
+
+        titles = [task.title for page in pages for task in page]
+        assert titles == ["t11", "t7", "t5", "t1"]
+
+
+class TestDeleteTask:
+    """Tests for delete_and_return_title / delete_task (DELETE ... RETURNING)."""
+
+    @staticmethod
+    async def _tag(session: AsyncSession, task_id: int) -> None:
+        tag = Tag(name="home")
+        session.add(tag)
+        await session.flush()
+        session.add(TaskTagLink(task_id=task_id, tag_id=tag.id))
+        await session.commit()
+
+    @staticmethod
+    async def _stored(session: AsyncSession) -> tuple[list[int], list[int]]:
+        """(task ids, linked task ids) as stored, bypassing the identity map."""
+        session.expire_all()
+        tasks = await session.exec(select(Task.id))
+        links = await session.exec(select(TaskTagLink.task_id))
+        return tasks.all(), links.all()
+
+    async def test_removes_task_and_tag_links(self, session: AsyncSession) -> None:
+        """Tag links go first, then the task; its title is returned."""
+        task_id = await add_task(session, "Buy groceries")
+        await self._tag(session, task_id)
+
+        title = await crud.delete_and_return_title(session, task_id, "user-1")
+
+        assert title == "Buy groceries"
+        assert await self._stored(session) == ([], [])
+        assert user_versions["user-1"] == 1
+
+    @pytest.mark.parametrize(
+        "delete", [crud.delete_and_return_title, crud.delete_task]
+    )
+    async def test_missing_task_leaves_nothing_pending(
+        self, session: AsyncSession, delete: Callable[..., Awaitable[object]]
+    ) -> None:
+        """No row: the transaction is rolled back and no version is bumped."""
+        result = await delete(session, 999, "user-1")
+
+        assert not result
+        assert not session.in_transaction()
+        assert not has_pending_bump(session, "user-1")
+        assert user_versions["user-1"] == 0
+
+    async def test_other_users_task_is_untouched(
+        self, session: AsyncSession
+    ) -> None:
+        """The user_id filter covers the tag links as well as the task."""
+        task_id = await add_task(session, "Not yours", user_id="user-2")
+        await self._tag(session, task_id)
+
+        deleted = await crud.delete_task(session, task_id, "user-1")
+
+        assert deleted is False
+        assert await self._stored(session) == ([task_id], [task_id])
+        assert user_versions["user-2"] == 0
@@ -0,0 +1,285 @@
+"""Tests for the MCP tools and their schema."""
+
+import json
+from datetime import datetime
+
+import pytest
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.cache import user_versions
+from src.mcp_tools import TOOL_DEFINITIONS, MCPToolExecutor, _coerce_id
+from src.models import Priority, Tag, Task, TaskTagLink
+from tests.conftest import add_task
+
+
+async def _stored(session: AsyncSession, task_id: int) -> Task | None:
+    """Re-read a task from the database, bypassing the identity map."""
+    session.expire_all()
+    result = await session.exec(select(Task).where(Task.id == task_id))
+    return result.one_or_none()
+
+
+@pytest.fixture
+def tools(session: AsyncSession) -> MCPToolExecutor:
+    """Tool executor for user-1."""
+    return MCPToolExecutor(session, "user-1")
+
+
+class TestCoerceId:
+    """Tests for _coerce_id (task ids supplied by the LLM)."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (5, 5),
+            (5.0, 5),
+            ("5", 5),
+            (" 42 ", 42),
+            (2**31 - 1, 2**31 - 1),
+        ],
+    )
+    def test_valid_ids(self, value: object, expected: int) -> None:
+        """Ints, integral floats and decimal strings are accepted."""
+        assert _coerce_id(value) == expected
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            True,
+            False,
+            2.7,
+            "2.7",
+            "abc",
+            "",
+            "²",
+            None,
+            [1],
+            # Out of int4 range for task.id - would fail in the driver
+            0,
+            -1,
+            "-1",
+            "0",
+            2**31,
+            "99999999999",
+            1e12,
+            "9" * 5000,
+        ],
+    )
+    def test_invalid_ids_return_none(self, value: object) -> None:
+        """Anything else is rejected before it reaches SQL."""
+        assert _coerce_id(value) is None
+
+    @pytest.mark.parametrize("task_id", ["99999999999", 2**31, -1, "2.7"])
+    async def test_execute_tool_rejects_bad_id_before_sql(
+        self, session: AsyncSession, tools: MCPToolExecutor, task_id: object
+    ) -> None:
+        """Bad ids get an error reply without any statement being run."""
+        result = await tools.execute_tool("delete_task", {"task_id": task_id})
+
+        assert result == {"error": f"Invalid task_id: {task_id}"}
+        assert not session.in_transaction()
+
+
+class TestToolDefinitions:
+    """Tests for TOOL_DEFINITIONS."""
+
+    def test_definitions_are_json_serializable(self) -> None:
+        """The schema is sent as-is in a request body's "tools" field."""
+        tools = json.loads(json.dumps(TOOL_DEFINITIONS))
+
+        assert [tool["function"]["name"] for tool in tools] == [
+            "add_task",
+            "list_tasks",
+            "complete_task",
+            "delete_task",
+            "update_task",
+        ]
+
+
+class TestWriteTools:
+    """Tests for add/complete/delete_task (single RETURNING statements)."""
+
+    async def test_add_task_returns_inserted_row(
+        self, session: AsyncSession, tools: MCPToolExecutor
+    ) -> None:
+        """INSERT ... RETURNING reports the stored values."""
+        result = await tools.add_task(
+            "Pay rent",
+            priority=Priority.HIGH,
+            due_date=datetime(2026, 11, 1, 9, 0),
+        )
+
+        assert result == {
+            "task_id": 1,
+            "status": "created",
+            "title": "Pay rent",
+            "priority": "high",
+            "due_date": "2026-11-01T09:00:00",
+        }
+        stored = await _stored(session, 1)
+        assert stored.user_id == "user-1"
+        assert stored.priority is Priority.HIGH
+
+    async def test_complete_task(
+        self, session: AsyncSession, tools: MCPToolExecutor
+    ) -> None:
+        """UPDATE ... RETURNING marks the task done in one statement."""
+        task_id = await add_task(session, "Buy groceries")
+
+        result = await tools.complete_task(task_id)
+
+        assert result == {
+            "task_id": task_id,
+            "status": "completed",
+            "title": "Buy groceries",
+        }
+        assert (await _stored(session, task_id)).completed is True
+
+    async def test_delete_task_removes_task_and_tag_links(
+        self, session: AsyncSession, tools: MCPToolExecutor
+    ) -> None:
+        """Tag links go first, then DELETE ... RETURNING title."""
+        task_id = await add_task(session, "Buy groceries")
+        tag = Tag(name="home")
+        session.add(tag)
+        await session.flush()
+        session.add(TaskTagLink(task_id=task_id, tag_id=tag.id))
+        await session.commit()
+
+        result = await tools.delete_task(task_id)
+
+        assert result == {
+            "task_id": task_id,
+            "status": "deleted",
+            "title": "Buy groceries",
+        }
+        assert await _stored(session, task_id) is None
+        links = await session.exec(select(TaskTagLink))
+        assert links.all() == []
+
+    @pytest.mark.parametrize("tool", ["complete_task", "delete_task"])
+    async def test_missing_task_is_not_found(
+        self, tools: MCPToolExecutor, tool: str
+    ) -> None:
+        """An empty RETURNING result means no such task."""
+        assert await getattr(tools, tool)(999) == {"error": "Task 999 not found"}
+
+    @pytest.mark.parametrize("tool", ["complete_task", "delete_task"])
+    async def test_other_users_task_is_not_found_and_untouched(
+        self, session: AsyncSession, tools: MCPToolExecutor, tool: str
+    ) -> None:
+        """The user_id filter is part of the write itself."""
+        task_id = await add_task(session, "Not yours", user_id="user-2")
+
+        result = await getattr(tools, tool)(task_id)
+
+        assert result == {"error": f"Task {task_id} not found"}
+        stored = await _stored(session, task_id)
+        assert stored is not None
+        assert stored.completed is False
+
+
+class TestUpdateTask:
+    """Tests for update_task (single UPDATE ... RETURNING)."""
+
+    async def test_updates_given_fields_only(
+        self, session: AsyncSession, tools: MCPToolExecutor
+    ) -> None:
+        """Omitted fields keep their stored values."""
+        task_id = await add_task(session, "Buy groceries", description="Details")
+
+        result = await tools.update_task(task_id, title="Buy oat milk")
+
+        assert result == {
+            "task_id": task_id,
+            "status": "updated",
+            "title": "Buy oat milk",
+        }
+        stored = await _stored(session, task_id)
+        assert stored.title == "Buy oat milk"
+        assert stored.description == "Details"
+
+    async def test_empty_description_clears_it(
+        self, session: AsyncSession, tools: MCPToolExecutor
+    ) -> None:
+        """description="" is a value, unlike an omitted description."""
+        task_id = await add_task(session, "Buy groceries", description="Details")
+
+        await tools.update_task(task_id, description="")
+
+        stored = await _stored(session, task_id)
+        assert stored.title == "Buy groceries"
+        assert stored.description == ""
+
+    async def test_missing_task_is_not_found(self, tools: MCPToolExecutor) -> None:
+        """An empty RETURNING result means no such task."""
+        result = await tools.update_task(999, title="x")
+
+        assert result == {"error": "Task 999 not found"}
+
+    async def test_other_users_task_is_not_found_and_untouched(
+        self, session: AsyncSession, tools: MCPToolExecutor
+    ) -> None:
+        """The user_id filter is part of the UPDATE itself."""
+        task_id = await add_task(session, "Not yours", user_id="user-2")
+
+        result = await tools.update_task(task_id, title="Mine now")
+
+        assert result == {"error": f"Task {task_id} not found"}
+        assert (await _stored(session, task_id)).title == "Not yours"
+
+
+class TestListTasks:
+    """Tests for list_tasks and its per-version result cache."""
+
+    async def test_lists_own_tasks_by_status(
+        self, session: AsyncSession, tools: MCPToolExecutor
+    ) -> None:
+        """Only the user's tasks, newest first, filtered by status."""
+        await add_task(session, "Buy groceries")
+        done_id = await add_task(session, "Pay rent")
+        await add_task(session, "Not yours", user_id="user-2")
+        await tools.complete_task(done_id)
+        await session.commit()
+
+        pending = await tools.list_tasks("pending")
+        completed = await tools.list_tasks("completed")
+
+        assert [task["title"] for task in pending] == ["Buy groceries"]
+        assert [task["title"] for task in completed] == ["Pay rent"]
+
+    async def test_repeat_list_is_served_from_cache(
+        self, session: AsyncSession, tools: MCPToolExecutor
+    ) -> None:
+        """Without a version bump, the database is not read again."""
+        await add_task(session, "Buy groceries")
+        first = await tools.list_tasks()
+
+        # Written behind the cache's back - no version bump
+        await add_task(session, "Pay rent")
+
+        assert await tools.list_tasks() == first
+
+    async def test_uncommitted_tool_write_bypasses_cache(
+        self, session: AsyncSession, tools: MCPToolExecutor
+    ) -> None:
+        """A turn's own writes are visible before the version moves."""
+        await tools.list_tasks()
+
+        await tools.add_task("Buy milk")
+        titles = [task["title"] for task in await tools.list_tasks()]
+
+        assert titles == ["Buy milk"]
+        assert user_versions["user-1"] == 0
+
+    async def test_commit_invalidates_cached_list(
+        self, session: AsyncSession, tools: MCPToolExecutor
+    ) -> None:
+        """After commit the new version misses the old cache entry."""
+        await tools.list_tasks()
+        await tools.add_task("Buy milk")
+        await session.commit()
+
+        assert [task["title"] for task in await tools.list_tasks()] == ["Buy milk"]
+        assert user_versions["user-1"] == 1
@@ -0,0 +1,62 @@
+"""Tests for GET /tasks keyset cursors."""
+
+import base64
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from src.models import TaskRead
+from src.routes.tasks import _decode_cursor, _encode_cursor
+
+
+def _task(created_at: datetime, task_id: int) -> TaskRead:
+    return TaskRead(
+        id=task_id,
+        user_id="user-1",
+        title="Buy groceries",
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+class TestCursor:
+    """Tests for _encode_cursor / _decode_cursor."""
+
+    def test_round_trip(self) -> None:
+        """A cursor decodes back to the task's (created_at, id)."""
+        created_at = datetime(2026, 1, 2, 3, 4, 5, 678901)
+
+        cursor = _encode_cursor(_task(created_at, 42))
+
+        assert _decode_cursor(cursor) == (created_at, 42)
+
+    def test_cursor_is_url_safe(self) -> None:
+        """Cursors travel in query strings unescaped."""
+        cursor = _encode_cursor(_task(datetime(2026, 1, 2), 7))
+
+        assert "+" not in cursor and "/" not in cursor
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "not-a-cursor!",
+            base64.urlsafe_b64encode(b"{}").decode(),
+            base64.urlsafe_b64encode(b'["2026-01-02"]').decode(),
+            base64.urlsafe_b64encode(b'["yesterday", 1]').decode(),
+            base64.urlsafe_b64encode(b'["2026-01-02", "x"]').decode(),
+            base64.urlsafe_b64encode(b"[1, 2]").decode(),
+            base64.urlsafe_b64encode(b'["2024-01-01T00:00:00+05:00", 5]').decode(),
+            base64.urlsafe_b64encode(b'["2026-01-02", 1099511627776]').decode(),
+            base64.urlsafe_b64encode(b'["2026-01-02", 0]').decode(),
+            base64.urlsafe_b64encode(b'["2026-01-02", 1.9]').decode(),
+            base64.urlsafe_b64encode(b'["2026-01-02", true]').decode(),
+            base64.urlsafe_b64encode(b'["2026-01-02", "5"]').decode(),
+        ],
+    )
+    def test_malformed_cursor_is_400(self, cursor: str) -> None:
+        """Garbage cursors are a client error, not a 500."""
+        with pytest.raises(HTTPException) as exc_info:
+            _decode_cursor(cursor)
+
+        assert exc_info.value.status_code == 400
@@ -10,7 +10,7 @@ This module provides the user interface following the specification:
 import typer
 from rich.console import Console
 from rich.panel import Panel
-from rich.prompt import Confirm, Prompt
+from rich.prompt import Confirm, IntPrompt, Prompt
 from rich.table import Table
 from rich.text import Text
 
@@ -31,30 +31,33 @@ app = typer.Typer(
 storage = InMemoryStorage()
 
 
-def display_menu() -> None:
-    """Display the main menu using Rich Panel."""
-    menu_text = """
-[bold cyan][1][/] 📋 View all tasks
+# Static menu and separator - built once, not on every loop iteration.
+# Markup is parsed into Text up front; a plain str would be re-parsed on
+# every print.
+MENU_PANEL = Panel(
+    Text.from_markup("""[bold cyan][1][/] 📋 View all tasks
 [bold cyan][2][/] ➕ Add new task
 [bold cyan][3][/] ✏️  Update task
 [bold cyan][4][/] 🗑️  Delete task
 [bold cyan][5][/] ✔️  Toggle complete/incomplete
-[bold cyan][0][/] 🚪 Exit
-"""
-    panel = Panel(
-        menu_text.strip(),
-        title="🗒️ [bold blue]TODO CONSOLE - Phase I[/]",
-        border_style="blue",
-        padding=(1, 2),
-    )
-    console.print(panel)
+[bold cyan][0][/] 🚪 Exit"""),
+    title=Text.from_markup("🗒️ [bold blue]TODO CONSOLE - Phase I[/]"),
+    border_style="blue",
+    padding=(1, 2),
+)
+SEPARATOR = "-" * 30
+
+
+def display_menu() -> None:
+    """Display the main menu using Rich Panel."""
+    console.print(MENU_PANEL)
 
 
 def view_tasks() -> None:
     """Display all tasks in a Rich Table (FR-004)."""
-    tasks = storage.get_all()
+    total, complete, pending = storage.count()
 
-    if not tasks:
+    if not total:
         console.print(
             Panel(
                 "[yellow]No tasks found. Add one![/]",
@@ -77,7 +80,8 @@ def view_tasks() -> None:
     table.add_column("Title", style="white", min_width=20)
     table.add_column("Description", style="dim", min_width=25)
 
-    for task in tasks:
+    # Rows are streamed from storage - no intermediate list of tasks
+    for task in storage.iter_all():
         # Status icon with color
         if task.completed:
             status = Text("✅", style="green")
@@ -96,7 +100,6 @@ def view_tasks() -> None:
     console.print(table)
 
     # Summary
-    total, complete, pending = storage.count()
     console.print(
         f"\n[bold]Total:[/] {total} tasks "
         f"([green]{complete} complete[/], [red]{pending} pending[/])"
@@ -106,7 +109,7 @@ def view_tasks() -> None:
 def add_task() -> None:
     """Add a new task (FR-001)."""
     console.print("\n[bold blue]➕ Add New Task[/]")
-    console.print("-" * 30)
+    console.print(SEPARATOR)
 
     title = Prompt.ask("[cyan]Title[/]")
     description = Prompt.ask("[cyan]Description[/] (optional)", default="")
@@ -124,13 +127,10 @@ def add_task() -> None:
 def update_task() -> None:
     """Update an existing task (FR-003)."""
     console.print("\n[bold blue]✏️ Update Task[/]")
-    console.print("-" * 30)
+    console.print(SEPARATOR)
 
-    try:
-        task_id = int(Prompt.ask("[cyan]Task ID to update[/]"))
-    except ValueError:
-        console.print("[red]✗ Error:[/] Invalid ID format")
-        return
+    # IntPrompt re-asks on non-numeric input
+    task_id = IntPrompt.ask("[cyan]Task ID to update[/]")
 
     try:
         task = storage.get(task_id)
@@ -163,13 +163,9 @@ def update_task() -> None:
 def delete_task() -> None:
     """Delete a task with confirmation (FR-002)."""
     console.print("\n[bold blue]🗑️ Delete Task[/]")
-    console.print("-" * 30)
+    console.print(SEPARATOR)
 
-    try:
-        task_id = int(Prompt.ask("[cyan]Task ID to delete[/]"))
-    except ValueError:
-        console.print("[red]✗ Error:[/] Invalid ID format")
-        return
+    task_id = IntPrompt.ask("[cyan]Task ID to delete[/]")
 
     try:
         task = storage.get(task_id)
@@ -188,13 +184,9 @@ def delete_task() -> None:
 def toggle_complete() -> None:
     """Toggle task completion status (FR-005)."""
     console.print("\n[bold blue]✔️ Toggle Complete/Incomplete[/]")
-    console.print("-" * 30)
+    console.print(SEPARATOR)
 
-    try:
-        task_id = int(Prompt.ask("[cyan]Task ID to toggle[/]"))
-    except ValueError:
-        console.print("[red]✗ Error:[/] Invalid ID format")
-        return
+    task_id = IntPrompt.ask("[cyan]Task ID to toggle[/]")
 
     try:
         task = storage.toggle_complete(task_id)
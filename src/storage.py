@@ -2,8 +2,10 @@
 
 This module implements the TaskStorage interface from the specification:
 - add(): Create new task with auto-increment ID
+- add_many(): Create several tasks in one pass (bulk seed/import)
 - get(): Retrieve task by ID
 - get_all(): List all tasks sorted by ID
+- iter_all(): Iterate over all tasks in ID order without copying
 - update(): Modify task title/description
 - delete(): Remove task by ID
 - toggle_complete(): Toggle completion status
@@ -11,6 +13,9 @@ This module implements the TaskStorage interface from the specification:
 Storage is in-memory only (Phase I requirement).
 """
 
+import itertools
+from collections.abc import Iterable, Iterator
+
 from src.exceptions import (
     DescriptionTooLongError,
     EmptyTitleError,
@@ -32,13 +37,19 @@ class InMemoryStorage:
 
     Attributes:
         _tasks: Dictionary mapping task IDs to Task objects.
-        _next_id: Counter for generating unique task IDs.
+        _ids: itertools.count issuing unique task IDs; next() is a single
+            C call, so IDs stay unique without a lock if threads appear.
+        _complete_count: Number of completed tasks, kept in step by
+            toggle_complete() and delete() so count() is O(1).
     """
 
+    __slots__ = ("_tasks", "_ids", "_complete_count")
+
     def __init__(self) -> None:
         """Initialize empty storage."""
         self._tasks: dict[int, Task] = {}
-        self._next_id: int = 1
+        self._ids: Iterator[int] = itertools.count(1)
+        self._complete_count: int = 0
 
     def add(self, title: str, description: str = "") -> Task:
         """Create a new task.
@@ -50,6 +61,59 @@ class InMemoryStorage:
         Returns:
             The newly created Task object.
 
+        Raises:
+            EmptyTitleError: If title is empty or whitespace-only.
+            TitleTooLongError: If title exceeds 100 characters.
+            DescriptionTooLongError: If description exceeds 500 characters.
+        """
+        title, description = self._validate(title, description)
+
+        # Create task with auto-increment ID
+        task_id = next(self._ids)
+        task = Task(
+            id=task_id,
+            title=title,
+            description=description,
+        )
+        self._tasks[task_id] = task
+
+        return task
+
+    def add_many(self, rows: Iterable[tuple[str, str]]) -> list[Task]:
+        """Create several tasks in one pass.
+
+        Every row is validated before any task is stored, so an invalid
+        row leaves the storage unchanged.
+
+        Args:
+            rows: (title, description) pairs, validated as in add().
+
+        Returns:
+            The newly created Task objects, in input order.
+
+        Raises:
+            EmptyTitleError: If a title is empty or whitespace-only.
+            TitleTooLongError: If a title exceeds 100 characters.
+            DescriptionTooLongError: If a description exceeds 500 characters.
+        """
+        validated = [self._validate(title, description) for title, description in rows]
+
+        # validated first: zip stops there without drawing a spare ID
+        tasks = [
+            Task(id=task_id, title=title, description=description)
+            for (title, description), task_id in zip(validated, self._ids)
+        ]
+        self._tasks.update((task.id, task) for task in tasks)
+
+        return tasks
+
+    @staticmethod
+    def _validate(title: str, description: str) -> tuple[str, str]:
+        """Strip and validate a new task's title and description.
+
+        Returns:
+            The stripped (title, description) pair.
+
         Raises:
             EmptyTitleError: If title is empty or whitespace-only.
             TitleTooLongError: If title exceeds 100 characters.
@@ -67,16 +131,7 @@ class InMemoryStorage:
         if len(description) > MAX_DESCRIPTION_LENGTH:
             raise DescriptionTooLongError(MAX_DESCRIPTION_LENGTH)
 
-        # Create task with auto-increment ID
-        task = Task(
-            id=self._next_id,
-            title=title,
-            description=description,
-        )
-        self._tasks[self._next_id] = task
-        self._next_id += 1
-
-        return task
+        return title, description
 
     def get(self, task_id: int) -> Task:
         """Retrieve a task by ID.
@@ -90,17 +145,31 @@ class InMemoryStorage:
         Raises:
             TaskNotFoundError: If no task exists with the given ID.
         """
-        if task_id not in self._tasks:
+        task = self._tasks.get(task_id)
+        if task is None:
             raise TaskNotFoundError(task_id)
-        return self._tasks[task_id]
+        return task
 
     def get_all(self) -> list[Task]:
         """Retrieve all tasks sorted by ID.
 
+        IDs only ever increase, so dict insertion order is already ID order
+        and no sort is needed.
+
         Returns:
             List of Task objects sorted by ID ascending.
         """
-        return sorted(self._tasks.values(), key=lambda t: t.id)
+        return list(self._tasks.values())
+
+    def iter_all(self) -> Iterator[Task]:
+        """Iterate over all tasks in ID order without building a list.
+
+        Same order as get_all(). Do not add or delete tasks while iterating.
+
+        Yields:
+            Task objects in ID ascending order.
+        """
+        yield from self._tasks.values()
 
     def update(
         self,
@@ -124,7 +193,9 @@ class InMemoryStorage:
             TitleTooLongError: If new title exceeds 100 characters.
             DescriptionTooLongError: If new description exceeds 500 characters.
         """
-        task = self.get(task_id)
+        task = self._tasks.get(task_id)
+        if task is None:
+            raise TaskNotFoundError(task_id)
 
         # Update title if provided
         if title is not None:
@@ -156,9 +227,11 @@ class InMemoryStorage:
         Raises:
             TaskNotFoundError: If no task exists with the given ID.
         """
-        if task_id not in self._tasks:
+        task = self._tasks.pop(task_id, None)
+        if task is None:
             raise TaskNotFoundError(task_id)
-        del self._tasks[task_id]
+        if task.completed:
+            self._complete_count -= 1
         return True
 
     def toggle_complete(self, task_id: int) -> Task:
@@ -173,8 +246,11 @@ class InMemoryStorage:
         Raises:
             TaskNotFoundError: If no task exists with the given ID.
         """
-        task = self.get(task_id)
+        task = self._tasks.get(task_id)
+        if task is None:
+            raise TaskNotFoundError(task_id)
         task.completed = not task.completed
+        self._complete_count += 1 if task.completed else -1
         return task
 
     def count(self) -> tuple[int, int, int]:
@@ -183,8 +259,7 @@ class InMemoryStorage:
         Returns:
             Tuple of (total, complete, pending) counts.
         """
-        tasks = list(self._tasks.values())
-        total = len(tasks)
-        complete = sum(1 for t in tasks if t.completed)
+        total = len(self._tasks)
+        complete = self._complete_count
         pending = total - complete
         return total, complete, pending
@@ -57,6 +57,32 @@ class TestAddTask:
         assert task3.id == 3
 
 
+class TestAddMany:
+    """Tests for bulk task creation."""
+
+    def test_add_many_assigns_sequential_ids(self) -> None:
+        """Bulk-added tasks continue the ID sequence in input order."""
+        storage = InMemoryStorage()
+        storage.add("Existing")
+
+        tasks = storage.add_many([("First", "one"), ("  Second  ", "")])
+
+        assert [t.id for t in tasks] == [2, 3]
+        assert [t.title for t in tasks] == ["First", "Second"]
+        assert storage.get_all() == [storage.get(1), *tasks]
+        assert storage.add("Next").id == 4
+
+    def test_add_many_with_invalid_row_adds_nothing(self) -> None:
+        """One invalid row rejects the whole batch."""
+        storage = InMemoryStorage()
+
+        with pytest.raises(EmptyTitleError):
+            storage.add_many([("Valid", ""), ("   ", "")])
+
+        assert storage.get_all() == []
+        assert storage.add("First").id == 1
+
+
 class TestDeleteTask:
     """Tests for deleting tasks (FR-002)."""
 
@@ -131,6 +157,17 @@ class TestGetAllTasks:
 
         assert [t.id for t in tasks] == [1, 2, 3]
 
+    def test_iter_all_yields_tasks_in_id_order(self) -> None:
+        """iter_all streams the same tasks as get_all, in ID order."""
+        storage = InMemoryStorage()
+        storage.add("First")
+        storage.add("Second")
+        storage.add("Third")
+        storage.delete(2)
+
+        assert [t.id for t in storage.iter_all()] == [1, 3]
+        assert list(storage.iter_all()) == storage.get_all()
+
 
 class TestToggleComplete:
     """Tests for toggling completion (FR-005)."""
@@ -189,3 +226,17 @@ class TestCount:
         assert total == 3
         assert complete == 1
         assert pending == 2
+
+    def test_count_after_deleting_completed_task(self) -> None:
+        """Deleting or re-toggling a completed task updates the counts."""
+        storage = InMemoryStorage()
+        task1 = storage.add("Task 1")
+        task2 = storage.add("Task 2")
+        storage.add("Task 3")
+        storage.toggle_complete(task1.id)
+        storage.toggle_complete(task2.id)
+
+        storage.delete(task1.id)
+        storage.toggle_complete(task2.id)
+
+        assert storage.count() == (2, 0, 2)